@@ -0,0 +1,26 @@
+#!/bin/bash
+# Build a precompiled zipapp of Fei.
+#
+# Python CLI startup is dominated by locating and parsing source files.
+# Compiling the package to .pyc ahead of time and shipping it as a single
+# zipapp skips the source parse on every `fei` invocation.
+#
+# Usage: ./build_pyz.sh [output]
+
+set -e
+
+OUTPUT="${1:-fei.pyz}"
+BUILD_DIR="$(mktemp -d)"
+trap 'rm -rf "$BUILD_DIR"' EXIT
+
+# Copy the package and precompile to legacy-layout .pyc (sibling files)
+cp -r fei "$BUILD_DIR/fei"
+python3 -m compileall -q -b "$BUILD_DIR/fei"
+
+# Drop the sources so the zipapp loads .pyc only
+find "$BUILD_DIR/fei" -name "*.py" -delete
+find "$BUILD_DIR/fei" -name "__pycache__" -type d -exec rm -rf {} +
+
+python3 -m zipapp "$BUILD_DIR" -m "fei.ui.cli:main" -p "/usr/bin/env python3" -o "$OUTPUT"
+
+echo "Built $OUTPUT"
@@ -28,7 +28,12 @@ class MemdirConnector:
     # Class variable to track server process
     _server_process = None
     _port = 5000
-    
+
+    # Shared keep-alive session so repeated calls reuse pooled connections
+    # instead of paying a TCP handshake per request
+    _session = requests.Session()
+    _session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
     def __init__(self, server_url: Optional[str] = None, api_key: Optional[str] = None, 
                  auto_start: bool = False):
         """
@@ -104,7 +109,7 @@ class MemdirConnector:
         # with the memdir_server_start tool when needed
             
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self._session.request(method, url, **kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -162,7 +167,7 @@ class MemdirConnector:
             
             # Verify that it's actually a Memdir server by checking the health endpoint
             try:
-                response = requests.get(f"{self.server_url}/health", timeout=1.0)
+                response = self._session.get(f"{self.server_url}/health", timeout=1.0)
                 if response.status_code == 200:
                     logger.info("Verified Memdir server is running on the port.")
                     return True
@@ -217,7 +222,7 @@ class MemdirConnector:
             for i in range(10):  # 10 attempts, 0.5s each = 5s total
                 time.sleep(0.5)
                 try:
-                    response = requests.get(f"{self.server_url}/health", timeout=0.5)
+                    response = self._session.get(f"{self.server_url}/health", timeout=0.5)
                     if response.status_code == 200:
                         logger.info(f"Memdir server started successfully after {i/2:.1f}s")
                         return True
@@ -275,7 +280,7 @@ class MemdirConnector:
             
         try:
             # Use a shorter timeout to avoid hanging
-            response = requests.get(f"{self.server_url}/health", timeout=1.0)
+            response = self._session.get(f"{self.server_url}/health", timeout=1.0)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             # Don't log every connection failure - it's too noisy
@@ -571,7 +576,7 @@ class MemdirConnector:
         
         # Try to connect to verify it started
         try:
-            response = requests.get(f"{self.server_url}/health", timeout=1.0)
+            response = self._session.get(f"{self.server_url}/health", timeout=1.0)
             if response.status_code == 200:
                 return {"status": "started", "message": "Memdir server started successfully"}
         except:
@@ -5,14 +5,15 @@ Command-line interface for Fei code assistant
 
 import os
 import sys
-import asyncio
+import logging
 import argparse
 import readline
 import atexit
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Deque
+from typing import Callable, Dict, List, Any, Coroutine, Optional, Deque, TypeVar
 from collections import deque
+from itertools import islice
 
 # Try to import prompt_toolkit for better input handling
 try:
@@ -24,18 +25,20 @@ try:
 except ImportError:
     PROMPT_TOOLKIT_AVAILABLE = False
 
-from fei.core.assistant import Assistant
-from fei.core.mcp import MCPManager
-from fei.tools.registry import ToolRegistry
-from fei.tools.handlers import (
-    glob_tool_handler,
-    grep_tool_handler,
-    view_handler,
-    edit_handler,
-    replace_handler,
-    ls_handler
-)
-from fei.tools.definitions import TOOL_DEFINITIONS
+# Optional uvloop support, resolved once at import time (no Windows build)
+if sys.platform != "win32":
+    try:
+        import uvloop
+        _HAS_UVLOOP = True
+    except ImportError:
+        uvloop = None
+        _HAS_UVLOOP = False
+else:
+    uvloop = None
+    _HAS_UVLOOP = False
+
+# Heavy modules (assistant, MCP, tools) are imported lazily inside the
+# functions that need them; CLI startup is dominated by import cost
 from fei.utils.config import Config
 from fei.utils.logging import get_logger
 
@@ -53,44 +56,88 @@ COLORS = {
     "red": "\033[31m",
 }
 
+# Decide once at import time whether to emit ANSI codes; bare strings are
+# used when output is piped
+_USE_COLOR = sys.stdout.isatty()
+
 def colorize(text: str, color: str) -> str:
     """Apply color to text"""
+    if not _USE_COLOR:
+        return text
     return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
 
+# Prebuilt message for the interrupt exit path, pre-encoded so Ctrl-C
+# handling is a single write syscall with no formatting or buffering
+_INTERRUPTED_BYTES = (colorize("\nInterrupted by user. Goodbye!", "bold") + "\n").encode()
+
+# Fei data directory in user's home, created once at import time so the
+# individual commands don't each have to stat/mkdir it. Creation is best
+# effort: with a missing/unwritable $HOME the commands that actually
+# write here surface the error themselves, and read-only paths like
+# --help still work
+FEI_DIR = Path.home() / ".fei"
+try:
+    FEI_DIR.mkdir(parents=True, exist_ok=True)
+except OSError:
+    pass
+
+# Single-thread executor for background history saves; one worker
+# serializes the writers so rapid turns can't run two concurrent
+# rewrites of the same file
+_history_executor = None
+
+def _get_history_executor():
+    """Get the shared single-worker executor for history saves"""
+    global _history_executor
+    if _history_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _history_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fei-history")
+    return _history_executor
+
 class CLI:
     """Command-line interface for Fei code assistant"""
-    
+
+    # Fixed attribute set; slots avoid the per-instance dict and make
+    # attribute access cheaper in the chat loop
+    __slots__ = (
+        "config",
+        "tool_registry",
+        "_tool_summaries",
+        "assistant",
+        "history",
+        "history_file",
+        "_save_future",
+        "prompt_session",
+    )
+
     def __init__(self):
         """Initialize CLI"""
         self.config = Config()
         self.tool_registry = self.setup_tools()
+        # Tool set is immutable after setup_tools, so precompute the
+        # (name, first description line) pairs used for display
+        self._tool_summaries = tuple(
+            (tool["name"], tool["description"].partition("\n")[0])
+            for tool in self.tool_registry.get_tools()
+        )
         self.assistant = None
         self.history = deque(maxlen=100)  # Store last 100 messages
         self.history_file = self.get_history_file_path()
+        self._save_future = None  # In-flight background history save, if any
         self.setup_history()
     
     def get_history_file_path(self) -> Path:
         """Get the path to the history file"""
-        # Create .fei directory in user's home directory if it doesn't exist
-        home_dir = Path.home()
-        fei_dir = home_dir / ".fei"
-        fei_dir.mkdir(exist_ok=True)
-        
-        # Return path to history file
-        return fei_dir / "history.json"
+        return FEI_DIR / "history.json"
 
     def setup_history(self) -> None:
         """Set up command history using readline or prompt_toolkit"""
         # Load history from file if it exists
         self.load_history()
-        
-        # Set up history directory
-        history_dir = Path.home() / ".fei"
-        history_dir.mkdir(exist_ok=True)
-        
+
         if PROMPT_TOOLKIT_AVAILABLE:
             # Use prompt_toolkit for better handling
-            prompt_history_file = str(history_dir / "prompt_history")
+            prompt_history_file = str(FEI_DIR / "prompt_history")
             self.prompt_session = PromptSession(
                 history=FileHistory(prompt_history_file),
                 auto_suggest=AutoSuggestFromHistory(),
@@ -100,7 +147,7 @@ class CLI:
             )
         else:
             # Fall back to readline if prompt_toolkit is not available
-            readline_history_file = history_dir / "readline_history"
+            readline_history_file = FEI_DIR / "readline_history"
             try:
                 readline.read_history_file(readline_history_file)
             except FileNotFoundError:
@@ -130,27 +177,45 @@ class CLI:
     def save_history(self) -> None:
         """Save message history to file"""
         try:
-            with open(self.history_file, 'w') as f:
+            # Write a sibling file and replace atomically so an exit
+            # mid-write can't truncate the existing history
+            tmp_path = self.history_file.with_suffix(".json.tmp")
+            with open(tmp_path, 'w') as f:
                 json.dump(list(self.history), f)
-                logger.debug(f"Saved {len(self.history)} messages to history")
+            os.replace(tmp_path, self.history_file)
+            logger.debug(f"Saved {len(self.history)} messages to history")
         except Exception as e:
             logger.error(f"Failed to save history: {e}")
-    
-    def setup_tools(self) -> ToolRegistry:
+
+    def save_history_in_background(self) -> None:
+        """Save history off the chat loop; the single worker serializes overlapping saves"""
+        loop = asyncio.get_running_loop()
+        self._save_future = loop.run_in_executor(_get_history_executor(), self.save_history)
+
+    async def wait_for_pending_save(self) -> None:
+        """Wait for any in-flight background history save to finish"""
+        if self._save_future is not None:
+            await self._save_future
+            self._save_future = None
+
+    def setup_tools(self) -> "ToolRegistry":
         """Set up tool registry with all tools"""
+        from fei.tools.registry import ToolRegistry
+
         registry = ToolRegistry()
-        
+
         # Use the centralized tool registration function
         from fei.tools.code import create_code_tools
         create_code_tools(registry)
-        
+
         return registry
-    
-    def setup_assistant(self, api_key: Optional[str] = None, model: Optional[str] = None, provider: Optional[str] = None) -> Assistant:
+
+    def setup_assistant(self, api_key: Optional[str] = None, model: Optional[str] = None, provider: Optional[str] = None) -> "Assistant":
         """Set up assistant"""
         # The API key check is now handled inside the Assistant class
         # based on the selected provider
-        
+        from fei.core.assistant import Assistant
+
         return Assistant(
             config=self.config,
             api_key=api_key,
@@ -170,8 +235,8 @@ class CLI:
     def print_available_tools(self) -> None:
         """Print available tools"""
         print(colorize("\nAvailable tools:", "bold"))
-        for tool in self.tool_registry.get_tools():
-            print(colorize(f"- {tool['name']}: ", "yellow") + tool["description"].split("\n")[0])
+        for name, description in self._tool_summaries:
+            print(colorize(f"- {name}: ", "yellow") + description)
     
     async def chat_loop(self) -> None:
         """Interactive chat loop"""
@@ -202,6 +267,7 @@ class CLI:
             
             if message.lower() in ["exit", "quit"]:
                 # Save history before exiting
+                await self.wait_for_pending_save()
                 self.save_history()
                 print(colorize("\nGoodbye!", "bold"))
                 break
@@ -230,38 +296,16 @@ class CLI:
                     "timestamp": asyncio.get_event_loop().time()
                 })
                 
-                # Save history after each interaction
-                self.save_history()
-                
+                # Save history after each interaction, off the hot path so
+                # the next prompt isn't blocked on the disk write
+                self.save_history_in_background()
+
                 # Make sure we display the response appropriately
                 print(colorize("\nFei: ", "bold"))
                 
                 # Check if the response is empty or None
                 if not response or response.strip() == "None":
-                    # Look at the last few messages in the conversation to find tool results
-                    tool_outputs = []
-                    conversation = self.assistant.conversation
-                    
-                    # Go through the last few messages to extract tool results
-                    for msg in reversed(conversation[-5:] if len(conversation) >= 5 else conversation):
-                        if msg.get("role") == "tool":
-                            try:
-                                # Parse tool content if it's a string
-                                content = msg.get("content", "")
-                                if isinstance(content, str) and content.startswith("{") and content.endswith("}"):
-                                    import json
-                                    tool_result = json.loads(content)
-                                    if "stdout" in tool_result and tool_result["stdout"]:
-                                        tool_outputs.append(f"\nCommand output:\n{tool_result['stdout']}")
-                            except Exception:
-                                pass
-                    
-                    # Display tool outputs or a message about missing output
-                    if tool_outputs:
-                        for output in tool_outputs:
-                            print(output)
-                    else:
-                        print("Command executed, but no output was returned.")
+                    self._display_fallback_from_conversation()
                 else:
                     # Display the normal response
                     print(response)
@@ -274,14 +318,47 @@ class CLI:
             print(colorize("No history available.", "yellow"))
             return
             
-        print(colorize("\nCommand History:", "bold"))
+        # Build the whole listing in memory and write it in one go rather
+        # than issuing several prints (and stdout flushes) per entry
+        buf = [colorize("\nCommand History:", "bold"), "\n"]
+        separator = colorize("─" * 50, "blue")
         for i, entry in enumerate(self.history, 1):
-            print(colorize(f"\n[{i}] You: ", "yellow"))
-            print(entry["user"])
-            print(colorize(f"\nFei: ", "cyan"))
-            print(entry["assistant"][:200] + "..." if len(entry["assistant"]) > 200 else entry["assistant"])
-            print(colorize("─" * 50, "blue"))
+            assistant = entry["assistant"]
+            if len(assistant) > 200:
+                assistant = assistant[:200] + "..."
+            buf.append(colorize(f"\n[{i}] You: ", "yellow"))
+            buf.append(f"\n{entry['user']}\n")
+            buf.append(colorize("\nFei: ", "cyan"))
+            buf.append(f"\n{assistant}\n")
+            buf.append(f"{separator}\n")
+        sys.stdout.write("".join(buf))
     
+    def _display_fallback_from_conversation(self) -> None:
+        """Display recent tool output when the assistant returned an empty response"""
+        tool_outputs = []
+        conversation = self.assistant.conversation
+
+        # Go through the last few messages to extract tool results
+        # (islice over the reversed view avoids copying a slice)
+        for msg in islice(reversed(conversation), 5):
+            if msg.get("role") == "tool":
+                try:
+                    # Parse tool content if it's a string
+                    content = msg.get("content", "")
+                    if isinstance(content, str) and content.startswith("{") and content.endswith("}"):
+                        tool_result = json.loads(content)
+                        if "stdout" in tool_result and tool_result["stdout"]:
+                            tool_outputs.append(f"\nCommand output:\n{tool_result['stdout']}")
+                except Exception:
+                    pass
+
+        # Display tool outputs or a message about missing output
+        if tool_outputs:
+            for output in tool_outputs:
+                print(output)
+        else:
+            print("Command executed, but no output was returned.")
+
     async def process_single_message(self, message: str) -> None:
         """Process a single message and exit"""
         try:
@@ -298,41 +375,21 @@ class CLI:
                 "timestamp": asyncio.get_event_loop().time()
             })
             
-            # Save history
-            self.save_history()
-            
+            # Save history in the background while the response is displayed
+            self.save_history_in_background()
+
             # Check if the response is empty or None
             if not response or response.strip() == "None":
-                # Look at the last few messages in the conversation to find tool results
-                tool_outputs = []
-                conversation = self.assistant.conversation
-                
-                # Go through the last few messages to extract tool results
-                for msg in reversed(conversation[-5:] if len(conversation) >= 5 else conversation):
-                    if msg.get("role") == "tool":
-                        try:
-                            # Parse tool content if it's a string
-                            content = msg.get("content", "")
-                            if isinstance(content, str) and content.startswith("{") and content.endswith("}"):
-                                import json
-                                tool_result = json.loads(content)
-                                if "stdout" in tool_result and tool_result["stdout"]:
-                                    tool_outputs.append(f"Command output:\n{tool_result['stdout']}")
-                        except Exception:
-                            pass
-                
-                # Display tool outputs or a message about missing output
-                if tool_outputs:
-                    for output in tool_outputs:
-                        print(output)
-                else:
-                    print("Command executed, but no output was returned.")
+                self._display_fallback_from_conversation()
             else:
                 # Display the normal response
                 print(response)
+
+            # Make sure the write finished before the process exits
+            await self.wait_for_pending_save()
         except Exception as e:
             print(colorize(f"Error: {e}", "red"))
-    
+
     async def process_continuous_task(self, task: str, max_iterations: int = 10) -> None:
         """Process a continuous task without requiring user prompts"""
         from fei.core.task_executor import TaskExecutor
@@ -362,9 +419,9 @@ When the task is completely finished, include the exact text [TASK_COMPLETE] at
 
     async def run(self, args: argparse.Namespace) -> None:
         """Run CLI with parsed arguments"""
-        # Set up logging
+        # Set up logging (integer level skips the name-to-level lookup)
         if args.debug:
-            get_logger("fei").setLevel("DEBUG")
+            get_logger("fei").setLevel(logging.DEBUG)
         
         # Set up assistant
         self.assistant = self.setup_assistant(args.api_key, args.model, args.provider)
@@ -383,8 +440,150 @@ When the task is completely finished, include the exact text [TASK_COMPLETE] at
             await self.chat_loop()
 
 
+# Flags handled by the fast parser; values map to Namespace attribute names
+_FAST_VALUE_FLAGS = {
+    "--api-key": "api_key",
+    "--model": "model",
+    "--provider": "provider",
+    "-m": "message",
+    "--message": "message",
+    "--task": "task",
+    "--max-iterations": "max_iterations",
+}
+
+_PROVIDER_CHOICES = ("anthropic", "openai", "groq")
+
+def _fast_parse() -> Optional[argparse.Namespace]:
+    """
+    Parse the common no-subcommand invocation without building the argparse tree
+
+    argparse construction costs tens of milliseconds, which dominates startup
+    for simple calls like `fei -m "..."`. Returns a Namespace with the same
+    attributes argparse would produce, or None when a subcommand, --help, or
+    anything else the fast path doesn't understand is present (the caller then
+    falls back to the full parser).
+    """
+    args = argparse.Namespace(
+        api_key=None,
+        model=None,
+        provider="anthropic",
+        debug=False,
+        message=None,
+        textual=False,
+        task=None,
+        max_iterations=10,
+        command=None,
+    )
+
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+
+        # Support both "--flag value" and "--flag=value" forms
+        if arg.startswith("--") and "=" in arg:
+            arg, _, value = arg.partition("=")
+            inline_value = True
+        else:
+            inline_value = False
+
+        if arg == "--debug":
+            args.debug = True
+        elif arg == "--textual":
+            args.textual = True
+        elif arg in _FAST_VALUE_FLAGS:
+            if not inline_value:
+                i += 1
+                if i >= len(argv):
+                    return None  # Missing value; let argparse report the error
+                value = argv[i]
+            setattr(args, _FAST_VALUE_FLAGS[arg], value)
+        else:
+            # Subcommand, --help, or unknown flag: use the full parser
+            return None
+
+        i += 1
+
+    # Validate values the same way argparse would; fall back for error messages
+    if args.provider not in _PROVIDER_CHOICES:
+        return None
+
+    try:
+        args.max_iterations = int(args.max_iterations)
+    except (TypeError, ValueError):
+        return None
+
+    return args
+
+def _fast_parse_subcommand() -> Optional[argparse.Namespace]:
+    """
+    Parse flag-free subcommand invocations without the argparse tree
+
+    Handles the common shapes (`fei ask "..."`, `fei search "..."`,
+    `fei history`, `fei mcp list` etc.) with subparser defaults filled in.
+    Returns None for anything involving flags, which falls back to argparse.
+    """
+    argv = sys.argv[1:]
+    if not argv or any(a.startswith("-") for a in argv):
+        return None
+
+    command, rest = argv[0], argv[1:]
+    args = argparse.Namespace(
+        api_key=None,
+        model=None,
+        provider="anthropic",
+        debug=False,
+        message=None,
+        textual=False,
+        task=None,
+        max_iterations=10,
+        command=command,
+    )
+
+    if command == "ask" and len(rest) == 1:
+        args.question = rest[0]
+        args.search = True
+        return args
+
+    if command == "search" and len(rest) == 1:
+        args.query = rest[0]
+        args.count = 5
+        args.offset = 0
+        return args
+
+    if command == "history" and not rest:
+        args.mode = "chat"
+        args.limit = 10
+        args.clear = False
+        args.load = None
+        return args
+
+    if command == "mcp":
+        if rest == ["list"]:
+            args.mcp_command = "list"
+            return args
+        if len(rest) == 2 and rest[0] in ("remove", "set-default"):
+            args.mcp_command = rest[0]
+            args.id = rest[1]
+            return args
+        if len(rest) == 3 and rest[0] == "add":
+            args.mcp_command = "add"
+            args.id = rest[1]
+            args.url = rest[2]
+            return args
+
+    return None
+
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments"""
+    # Try the cheap hand-rolled parsers first; only build the full argparse
+    # tree when flags or an unrecognized shape require it
+    args = _fast_parse()
+    if args is None:
+        args = _fast_parse_subcommand()
+    if args is not None:
+        return args
+
     parser = argparse.ArgumentParser(description="Fei Code Assistant - Advanced code manipulation with AI assistance")
     
     parser.add_argument("--api-key", help="API key (defaults to provider-specific environment variable)")
@@ -441,14 +640,52 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-async def handle_history_command(args: argparse.Namespace) -> None:
-    """Handle history command"""
-    home_dir = Path.home()
-    fei_dir = home_dir / ".fei"
-    fei_dir.mkdir(exist_ok=True)
-    
+def _ask_history_file() -> Path:
+    """Return the ask-history JSONL path, migrating the legacy JSON file
+
+    Earlier versions kept ask history as a single JSON list in
+    ask_history.json. On first touch, any legacy entries are folded into
+    ask_history.jsonl ahead of newer ones and the old file is removed, so
+    history viewing, --load indices and --clear all see one file.
+    """
+    history_file = FEI_DIR / "ask_history.jsonl"
+    legacy_file = FEI_DIR / "ask_history.json"
+
+    if legacy_file.exists():
+        try:
+            with open(legacy_file, 'r') as f:
+                entries = json.load(f)
+
+            if isinstance(entries, list) and entries:
+                migrated = "".join(json.dumps(entry) + "\n" for entry in entries)
+                # Legacy entries predate anything already in the JSONL
+                existing = history_file.read_text() if history_file.exists() else ""
+                tmp_path = history_file.with_suffix(".jsonl.tmp")
+                tmp_path.write_text(migrated + existing)
+                os.replace(tmp_path, history_file)
+
+            legacy_file.unlink()
+        except Exception as e:
+            logger.error(f"Failed to migrate ask history: {e}")
+
+    return history_file
+
+
+async def handle_history_command(args: argparse.Namespace, cli: Optional[CLI] = None) -> None:
+    """
+    Handle history command
+
+    Args:
+        args: Parsed command-line arguments
+        cli: Optional preconstructed CLI to reuse for the --load path,
+            avoiding a second round of tool registration and history I/O
+    """
     mode = args.mode
-    history_file = fei_dir / f"{mode}_history.json"
+    # Ask history is stored as append-only JSONL; chat history as a JSON list
+    if mode == "ask":
+        history_file = _ask_history_file()
+    else:
+        history_file = FEI_DIR / f"{mode}_history.json"
     
     if args.clear:
         # Clear history
@@ -465,7 +702,18 @@ async def handle_history_command(args: argparse.Namespace) -> None:
     # Load history
     try:
         with open(history_file, 'r') as f:
-            history = json.load(f)
+            if mode == "ask":
+                if args.load is not None:
+                    # --load needs absolute indexing, so read everything
+                    history = [json.loads(line) for line in f if line.strip()]
+                else:
+                    # Stream the file and keep only the tail we will display
+                    history = list(deque(
+                        (json.loads(line) for line in f if line.strip()),
+                        maxlen=args.limit
+                    ))
+            else:
+                history = json.load(f)
     except Exception as e:
         print(colorize(f"Error loading history: {e}", "red"))
         return
@@ -487,10 +735,13 @@ async def handle_history_command(args: argparse.Namespace) -> None:
         entry = history[load_idx]
         
         if mode == "chat":
-            # Start a new chat with this message
-            cli = CLI()
-            cli.setup_assistant()
-            
+            # Start a new chat with this message, reusing the caller's CLI
+            # (and its tool registry) when one was provided
+            if cli is None:
+                cli = CLI()
+            if cli.assistant is None:
+                cli.assistant = cli.setup_assistant()
+
             print(colorize("\nLoading chat from history...", "cyan"))
             print(colorize(f"Original user message: {entry['user']}", "yellow"))
             
@@ -517,24 +768,33 @@ async def handle_history_command(args: argparse.Namespace) -> None:
     # Limit number of entries
     history = history[-args.limit:] if len(history) > args.limit else history
     
-    print(colorize(f"\n{mode.capitalize()} History:", "bold"))
-    
+    # Build the listing in memory and write it with a single stdout write
+    buf = [colorize(f"\n{mode.capitalize()} History:", "bold"), "\n"]
+    separator = colorize("─" * 50, "blue")
+
     for i, entry in enumerate(history, 1):
         if mode == "chat":
-            print(colorize(f"\n[{i}] You: ", "yellow"))
-            print(entry["user"])
-            print(colorize("\nFei: ", "cyan"))
-            print(entry["assistant"][:200] + "..." if len(entry["assistant"]) > 200 else entry["assistant"])
+            answer = entry["assistant"]
+            buf.append(colorize(f"\n[{i}] You: ", "yellow"))
+            buf.append(f"\n{entry['user']}\n")
+            buf.append(colorize("\nFei: ", "cyan"))
         else:  # ask mode
-            print(colorize(f"\n[{i}] Question: ", "yellow"))
-            print(entry["question"])
-            print(colorize("\nAnswer: ", "cyan"))
-            print(entry["answer"][:200] + "..." if len(entry["answer"]) > 200 else entry["answer"])
-        
-        print(colorize("─" * 50, "blue"))
+            answer = entry["answer"]
+            buf.append(colorize(f"\n[{i}] Question: ", "yellow"))
+            buf.append(f"\n{entry['question']}\n")
+            buf.append(colorize("\nAnswer: ", "cyan"))
+
+        if len(answer) > 200:
+            answer = answer[:200] + "..."
+        buf.append(f"\n{answer}\n")
+        buf.append(f"{separator}\n")
+
+    sys.stdout.write("".join(buf))
 
 async def handle_mcp_command(args: argparse.Namespace) -> None:
     """Handle MCP commands"""
+    from fei.core.mcp import MCPManager
+
     config = Config()
     mcp_manager = MCPManager(config)
     
@@ -609,13 +869,14 @@ async def handle_search_command(args: argparse.Namespace) -> None:
         # Use direct search without trying MCP at all
         results = await search_brave(args.query, args.count, args.offset)
         
-        # Display results
-        print(colorize("\nSearch Results:", "bold"))
+        # Display results with a single write instead of four prints each
+        parts = [colorize("\nSearch Results:", "bold"), "\n"]
+        ap = parts.append
         for i, result in enumerate(results.get("web", {}).get("results", []), 1):
-            print(colorize(f"{i}. {result.get('title')}", "green"))
-            print(f"   URL: {colorize(result.get('url'), 'blue')}")
-            print(f"   {result.get('description')}")
-            print()
+            ap(colorize(f"{i}. {result.get('title')}", "green"))
+            ap(f"\n   URL: {colorize(result.get('url'), 'blue')}\n")
+            ap(f"   {result.get('description')}\n\n")
+        sys.stdout.write("".join(parts))
     
     except Exception as e:
         print(colorize(f"Search failed: {e}", "red"))
@@ -626,10 +887,7 @@ async def handle_ask_command(args: argparse.Namespace) -> None:
     
     try:
         # Initialize readline history for ask command
-        home_dir = Path.home()
-        fei_dir = home_dir / ".fei"
-        fei_dir.mkdir(exist_ok=True)
-        readline_history_file = fei_dir / "ask_history"
+        readline_history_file = FEI_DIR / "ask_history"
         
         try:
             readline.read_history_file(readline_history_file)
@@ -644,20 +902,16 @@ async def handle_ask_command(args: argparse.Namespace) -> None:
         if not PROMPT_TOOLKIT_AVAILABLE and args.question.strip():
             readline.add_history(args.question)
         
-        # Save user questions and answers
-        history_file = fei_dir / "ask_history.json"
-        history = []
-        
-        try:
-            if history_file.exists():
-                with open(history_file, 'r') as f:
-                    history = json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load ask history: {e}")
-            
+        # User questions and answers are appended to a JSONL file, so each
+        # ask is O(1) regardless of how long the history has grown
+        history_file = _ask_history_file()
+
         # Create tool registry
+        from fei.core.assistant import Assistant
+        from fei.tools.registry import ToolRegistry
+
         tool_registry = ToolRegistry()
-        
+
         # Create assistant
         assistant = Assistant(
             provider=args.provider,
@@ -684,14 +938,16 @@ When you use information from search results, cite the source in your answer."""
                 # Use direct search - bypass MCP completely
                 search_results = await search_brave(args.question, count=5)
                 
-                # Format search results for the LLM
-                search_context = "\n\nHere are some search results that may help answer the question:\n\n"
-                
+                # Format search results for the LLM; collect pieces and join
+                # once rather than growing a string in the loop
+                parts = ["\n\nHere are some search results that may help answer the question:\n\n"]
+                ap = parts.append
+
                 for i, result in enumerate(search_results.get("web", {}).get("results", []), 1):
-                    search_context += f"[{i}] {result.get('title')}\n"
-                    search_context += f"URL: {result.get('url')}\n"
-                    search_context += f"Summary: {result.get('description')}\n\n"
-                
+                    ap(f"[{i}] {result.get('title')}\nURL: {result.get('url')}\nSummary: {result.get('description')}\n\n")
+
+                search_context = "".join(parts)
+
                 # Add search results to the question
                 enhanced_question = args.question + search_context
                 
@@ -706,17 +962,16 @@ When you use information from search results, cite the source in your answer."""
         # Get assistant response
         response = await assistant.chat(enhanced_question, system_prompt=system_prompt)
         
-        # Save to history
-        history.append({
+        # Append this exchange to history
+        entry = {
             "question": args.question,
             "answer": response,
             "timestamp": asyncio.get_event_loop().time()
-        })
-        
-        # Save history
+        }
+
         try:
-            with open(history_file, 'w') as f:
-                json.dump(history, f)
+            with open(history_file, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
         except Exception as e:
             logger.error(f"Failed to save ask history: {e}")
         
@@ -728,27 +983,133 @@ When you use information from search results, cite the source in your answer."""
         print(colorize(f"Error: {e}", "red"))
 
 
+def _history_command(args: argparse.Namespace) -> Coroutine[Any, Any, None]:
+    """Build the history command coroutine, with a CLI only when --load needs one"""
+    cli = CLI() if args.load is not None and args.mode == "chat" else None
+    return handle_history_command(args, cli=cli)
+
+# Subcommand dispatch table; a dict lookup replaces the if/elif ladder
+_COMMAND_HANDLERS = {
+    "mcp": handle_mcp_command,
+    "search": handle_search_command,
+    "ask": handle_ask_command,
+    "history": _history_command,
+}
+
+# Type variable for async command results
+T = TypeVar('T')
+
+# asyncio is imported on first run_async_command call rather than at module
+# import: textual mode manages its own event loop and never needs it here
+asyncio = None
+
+# Reusable runner so repeated run_async_command calls in one process share
+# one event loop instead of paying setup/teardown on every call
+_runner = None
+
+def _get_runner() -> "asyncio.Runner":
+    """Get the shared asyncio.Runner, creating it on first use"""
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner(
+            loop_factory=uvloop.new_event_loop if _HAS_UVLOOP else None
+        )
+        atexit.register(_runner.close)
+    return _runner
+
 # Global event loop check function to handle asyncio properly
-def run_async_command(coro):
-    """Run an async command with proper event loop handling"""
+def run_async_command(factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+    """
+    Run an async command with proper event loop handling
+
+    Takes a zero-argument callable rather than a coroutine so the coroutine
+    isn't constructed until the target event loop is in place.
+    """
+    global asyncio
+    if asyncio is None:
+        import asyncio
+
     try:
         # Check if we're already in an event loop
         loop = asyncio.get_running_loop()
-        # We're in an event loop, we should not be using asyncio.run
-        # Instead, use a helper method from the asyncio module to gather multiple tasks
-        return loop.run_until_complete(coro)
     except RuntimeError:
-        # No event loop exists, use asyncio.run
-        return asyncio.run(coro)
+        loop = None
+
+    if loop is not None:
+        # We're in an event loop, we should not be using asyncio.run
+        return loop.run_until_complete(factory())
+
+    if not hasattr(asyncio, "Runner"):
+        # Python < 3.11 has no reusable Runner; plain asyncio.run still
+        # picks up the uvloop policy installed at startup
+        return asyncio.run(factory())
+
+    # No running loop: run on the shared (uvloop-backed when available)
+    # runner, which keeps its loop alive across calls
+    runner = _get_runner()
+    return runner.run(factory())
+
+def _flush_persistence() -> None:
+    """Run the bounded persistence work that atexit would normally cover
+
+    os._exit skips atexit handlers, so the debounced config write, any
+    in-flight history save and the readline history file are flushed
+    explicitly before a hard exit. All of these are small local writes.
+    """
+    # Debounced config changes (normally flushed via atexit)
+    try:
+        from fei.utils import config as config_mod
+        if config_mod._config is not None:
+            config_mod._config.flush()
+    except Exception:
+        pass
+
+    # Join the in-flight background history save, if any
+    if _history_executor is not None:
+        try:
+            _history_executor.shutdown(wait=True)
+        except Exception:
+            pass
+
+    # Readline history (registered with atexit in the readline fallback)
+    if not PROMPT_TOOLKIT_AVAILABLE:
+        try:
+            readline.write_history_file(FEI_DIR / "readline_history")
+        except Exception:
+            pass
+
+    # os._exit discards the interpreter's stdio buffers, so anything
+    # already printed (e.g. when stdout is a pipe) must be pushed out now
+    try:
+        sys.stdout.flush()
+    except Exception:
+        pass
+
+def _enable_debug() -> None:
+    """Enable debug logging and interpreter-level diagnostics
+
+    Imported lazily so normal runs never pay for faulthandler/tracemalloc.
+    """
+    import faulthandler
+    import tracemalloc
+
+    faulthandler.enable()
+    tracemalloc.start()
+    get_logger("fei").setLevel(logging.DEBUG)
 
 def main() -> None:
     """Main entry point"""
+    # Prefer uvloop's libuv-backed event loop when available; it has no
+    # Windows support, so fall back silently there and when not installed
+    if _HAS_UVLOOP:
+        uvloop.install()
+
     args = parse_args()
     
-    # Set up logging
+    # Debug tooling is only set up when asked for
     if args.debug:
-        get_logger("fei").setLevel("DEBUG")
-    
+        _enable_debug()
+
     try:
         # Check if textual interface is requested
         if args.textual:
@@ -757,31 +1118,36 @@ def main() -> None:
             
             # Get the app directly, don't run it yet
             app = textual_main()
-            
-            # Run the app directly, don't use asyncio.run()
+
+            # Run the app directly, don't use asyncio.run(). Textual creates
+            # its own event loop inside App.run(), which picks up the uvloop
+            # policy installed above, so the TUI loop is libuv-backed too
             app.run()
             return
             
         # Handle specific commands
-        if args.command == "mcp":
-            run_async_command(handle_mcp_command(args))
-        elif args.command == "search":
-            run_async_command(handle_search_command(args))
-        elif args.command == "ask":
-            run_async_command(handle_ask_command(args))
-        elif args.command == "history":
-            run_async_command(handle_history_command(args))
+        handler = _COMMAND_HANDLERS.get(args.command)
+        if handler is not None:
+            run_async_command(lambda: handler(args))
         else:
             # Default to chat
             cli = CLI()
-            run_async_command(cli.run(args))
+            run_async_command(lambda: cli.run(args))
             
     except KeyboardInterrupt:
-        print(colorize("\nInterrupted by user. Goodbye!", "bold"))
+        # Persist the bounded state atexit would otherwise handle, then
+        # write straight to fd 1 and exit immediately; 130 is the shell
+        # convention for death by SIGINT
+        _flush_persistence()
+        os.write(1, _INTERRUPTED_BYTES)
+        os._exit(130)
     except Exception as e:
-        print(colorize(f"\nError: {e}", "red"))
+        print(colorize(f"\nError: {e}", "red"), file=sys.stderr)
         if args.debug:
             raise
+        # Exit directly instead of unwinding further with the captured
+        # traceback still attached
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
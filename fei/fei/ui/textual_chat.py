@@ -5,8 +5,13 @@ Textual-based modern chat interface for Fei code assistant
 
 import os
 import sys
+import logging
+import time
 import asyncio
-import argparse
+from collections import OrderedDict
+from types import SimpleNamespace
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Iterable
 
 from textual.app import App, ComposeResult
@@ -40,45 +45,83 @@ from fei.tools.handlers import (
     ls_handler
 )
 from fei.tools.definitions import TOOL_DEFINITIONS
-from fei.tools.memory_tools import create_memory_tools
+from fei.tools.memory_tools import (
+    create_memory_tools,
+    memory_list_handler,
+    memory_search_handler,
+    memory_view_handler,
+    memory_create_handler,
+    memory_search_by_tag_handler,
+    memdir_server_start_handler,
+    memdir_server_stop_handler,
+    memdir_server_status_handler,
+)
+from fei.tools.memdir_connector import MemdirConnector
 from fei.utils.config import Config
 from fei.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Assistant replies at least this long have their widget (and thus the
+# markdown parse) built on a worker thread instead of the event loop
+_THREAD_RENDER_MIN = 2048
+
+# Static UI strings, interned once instead of being rebuilt per call
+_ERR_INVALID_MEM_CMD = "Invalid memory command. Use '/mem help' for available commands."
+_ERR_MISSING_SERVER_CMD = "**Error:** Missing server command (start, stop, or status)"
+_STATUS_STOPPED = "**Memdir Server Status:** Stopped (not running)"
+_NO_MEMS_TAG_TMPL = "No memories found with tag: '%s'."
+
+
+@lru_cache(maxsize=32)
+def _fmt_err(prefix: str, msg: str) -> str:
+    """Format an error notice, deduplicating repeated identical errors"""
+    return f"**{prefix}:** {msg}"
+
+
 class ChatMessage(Static):
     """A chat message display widget"""
-    
+
+    # Per-sender (border style, panel title, content factory) constants,
+    # resolved with one dict lookup instead of branching on every rebuild
+    _STYLE = {
+        "user": ("rgb(174,225,252)", "You", Text),
+        "assistant": ("rgb(0,180,0)", "Assistant", RichMarkdown),
+    }
+
     def __init__(
-        self, 
-        content: str, 
-        sender: str = "user", 
-        *args, 
+        self,
+        content: str,
+        sender: str = "user",
+        streaming: bool = False,
+        *args,
         **kwargs
     ) -> None:
         super().__init__(*args, **kwargs)
         self.content = content
         self.sender = sender  # 'user' or 'assistant'
-        
-    def compose(self) -> ComposeResult:
-        """Compose the message with appropriate styling"""
-        # Different styling based on sender
-        if self.sender == "user":
-            style = "rgb(174,225,252)"  # Light blue
-            panel_title = "You"
-        else:
-            style = "rgb(0,180,0)"  # Green
-            panel_title = "Assistant"
-            
-        # Handle markdown for assistant messages
-        if self.sender == "assistant":
-            rendered_content = RichMarkdown(self.content)
-        else:
-            rendered_content = Text(self.content)
-            
+        # While True, further assistant output is appended to this widget
+        # instead of mounting a new one per chunk
+        self.streaming = streaming
+        # Parse/build the renderable once; recomposes after a resize or
+        # reflow reuse it instead of re-parsing the Markdown
+        self._renderable = self._build_renderable()
+
+    def _build_renderable(self) -> Panel:
+        """Build the styled panel for this message"""
+        # Any unknown sender keeps the old fallback of assistant styling
+        style, panel_title, factory = self._STYLE.get(
+            self.sender, self._STYLE["assistant"]
+        )
+
+        # Plain confirmations ("Memory saved...", server notices) carry no
+        # markdown syntax; render them as Text and skip the parser
+        if factory is RichMarkdown and not any(c in self.content for c in "*#_`["):
+            factory = Text
+
         # Create a panel with the content
-        panel = Panel(
-            rendered_content,
+        return Panel(
+            factory(self.content),
             title=panel_title,
             border_style=style,
             title_align="left",
@@ -86,44 +129,77 @@ class ChatMessage(Static):
             # Make panel subtle
             highlight=False
         )
-        
+
+    def update_content(self, content: str) -> None:
+        """Replace the content and re-render the mounted panel"""
+        self.content = content
+        self._renderable = self._build_renderable()
+        # compose() only runs once, so push the rebuilt panel into the
+        # mounted child directly; before mount, compose picks it up itself
+        if self.is_mounted:
+            self.query_one(Static).update(self._renderable)
+
+    def append(self, text: str) -> None:
+        """Append text to a streaming message, re-rendering it in place"""
+        self.update_content(self.content + text)
+
+    def compose(self) -> ComposeResult:
+        """Compose the message from the cached renderable"""
         yield Static(
-            panel,
+            self._renderable,
             classes=f"message {self.sender}"
         )
 
 class ChatContainer(Vertical):
     """Container for all chat messages with proper scrolling"""
-    
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Messages waiting to be mounted in the next flush
+        self._pending: List[ChatMessage] = []
+        self._flush_timer = None
+        # Capability check once at construction; the flush path then calls
+        # the bound method without per-message exception handling
+        assert hasattr(self, "scroll_end"), "Textual Vertical lost scroll_end"
+        self._scroll = self.scroll_end
+
     def compose(self) -> ComposeResult:
         """Nothing to compose initially - messages will be added dynamically"""
         yield from []  # Return an empty iterable instead of None
-    
-    async def add_message(self, content: str, sender: str = "user") -> None:
-        """Add a new message to the chat container and scroll to it"""
-        message = ChatMessage(content, sender=sender)
-        await self.mount(message)
-        
-        # Use the appropriate scrolling method based on Textual version
-        try:
-            # Try to scroll directly without await
-            self.scroll_end(animate=False)
-        except (AttributeError, TypeError):
-            try:
-                # Try standard scroll_to method
-                self.scroll_to(y=1000000)  # Scroll to a very large value to ensure we're at the bottom
-            except Exception as e:
-                # Last resort, just log the error and continue
-                print(f"Scrolling error: {e}")
-                pass
+
+    def queue_widget(self, message: ChatMessage) -> ChatMessage:
+        """Queue a prebuilt message widget for the next flush"""
+        self._pending.append(message)
+
+        # Flush at most once per frame (~60 Hz) so a burst of messages costs
+        # a single mount/layout/scroll pass instead of one per message
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(1 / 60, self._flush)
+        return message
+
+    async def add_message(
+        self, content: str, sender: str = "user", streaming: bool = False
+    ) -> ChatMessage:
+        """Queue a new message; mounts are coalesced into one flush per frame"""
+        return self.queue_widget(ChatMessage(content, sender=sender, streaming=streaming))
+
+    async def _flush(self) -> None:
+        """Mount all pending messages in one batch and scroll once"""
+        self._flush_timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        await self.mount_all(pending)
+        self._scroll(animate=False)
 
 class MemoryCommandSuggester(Suggester):
     """Custom suggester for memory commands"""
-    
+
     def __init__(self):
         """Initialize the memory command suggester"""
         super().__init__(use_cache=True, case_sensitive=False)
-        
+
         # List of main memory commands
         self.main_commands = [
             "/mem help",
@@ -136,14 +212,14 @@ class MemoryCommandSuggester(Suggester):
             "/mem server stop",
             "/mem server status"
         ]
-        
+
         # Sub-suggestions based on command context
         self.folder_suggestions = [
-            ".Projects", 
-            ".Archive", 
+            ".Projects",
+            ".Archive",
             ".Tags"
         ]
-        
+
         # Common tag suggestions
         self.tag_suggestions = [
             "python",
@@ -155,46 +231,116 @@ class MemoryCommandSuggester(Suggester):
             "fei",
             "bookmark"
         ]
-    
+
+        # Prefix indexes, built once so each keystroke resolves with a
+        # single dict lookup instead of scanning every candidate
+        self._main_index = self._build_prefix_index(self.main_commands)
+        self._folder_index = self._build_prefix_index(self.folder_suggestions)
+        self._tag_index = self._build_prefix_index(self.tag_suggestions)
+
+        # LRU cache of computed suggestions keyed by the exact input, so
+        # retyping or revisiting a prefix skips the trie walk entirely
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_maxsize = 256
+
+        # Last input and its result; Textual re-queries the suggester on
+        # focus and unrelated widget events, so the repeat case is common
+        self._last_value: Optional[str] = None
+        self._last_result: Optional[str] = None
+
+        # Context dispatch table, plus a prefix tuple so a single C-level
+        # startswith call decides whether the per-context loop runs at all
+        self._contexts = (
+            ("/mem list ", "_folder_index"),
+            ("/mem tag ", "_tag_index"),
+        )
+        self._context_prefixes = tuple(prefix for prefix, _ in self._contexts)
+
+    @staticmethod
+    def _build_prefix_index(phrases: List[str]) -> Dict[str, str]:
+        """
+        Map every proper prefix of each phrase to its best completion
+
+        Keys are lowercased so matching is case-insensitive while the
+        stored completion keeps its original casing; sorted insertion with
+        setdefault keeps the alphabetically first completion per prefix.
+        The vocabulary is small, so the index costs tens of KB at most.
+        """
+        index: Dict[str, str] = {}
+        for phrase in sorted(phrases):
+            lowered = phrase.lower()
+            for i in range(len(lowered)):
+                index.setdefault(lowered[:i], phrase)
+        return index
+
+    def update_folder_suggestions(self, folders: List[str]) -> None:
+        """Replace folder suggestions and rebuild their prefix index"""
+        self.folder_suggestions = sorted(folders)
+        self._folder_index = self._build_prefix_index(self.folder_suggestions)
+        self._cache.clear()
+        self._last_value = None
+
+    def update_tag_suggestions(self, tags: List[str]) -> None:
+        """Replace tag suggestions and rebuild their prefix index"""
+        self.tag_suggestions = sorted(tags)
+        self._tag_index = self._build_prefix_index(self.tag_suggestions)
+        self._cache.clear()
+        self._last_value = None
+
     async def get_suggestion(self, value: str) -> Optional[str]:
         """
         Try to get completion suggestion for the input value
-        
+
         Args:
             value: Current input value
-            
+
         Returns:
             Suggestion string or None
         """
         if not value:
             return None
-            
+
+        # Repeated identical queries short-circuit on a single compare
+        if value == self._last_value:
+            return self._last_result
+        raw_value = value
+
+        # The suggester is declared case-insensitive; normalize once up
+        # front so matching and caching both work on the lowered form
+        value = value.lower()
+
+        # Serve repeated prefixes straight from the LRU cache
+        cache = self._cache
+        if value in cache:
+            cache.move_to_end(value)
+            self._last_value = raw_value
+            self._last_result = cache[value]
+            return self._last_result
+
+        suggestion = None
+
         # For main command suggestions
         if value.startswith("/"):
-            for cmd in self.main_commands:
-                if cmd.startswith(value) and cmd != value:
-                    return cmd
-        
-        # For folder suggestions after "/mem list "
-        if value.startswith("/mem list "):
-            prefix = "/mem list "
-            folder_part = value[len(prefix):]
-            
-            for folder in self.folder_suggestions:
-                if folder.startswith(folder_part) and folder != folder_part:
-                    return prefix + folder
-        
-        # For tag suggestions after "/mem tag "
-        if value.startswith("/mem tag "):
-            prefix = "/mem tag "
-            tag_part = value[len(prefix):]
-            
-            for tag in self.tag_suggestions:
-                if tag.startswith(tag_part) and tag != tag_part:
-                    return prefix + tag
-                    
-        # No suggestion found
-        return None
+            suggestion = self._main_index.get(value)
+
+            if suggestion is None and value.startswith(self._context_prefixes):
+                # Context-specific suggestions after "/mem list "/"/mem tag "
+                for prefix, index_attr in self._contexts:
+                    if value.startswith(prefix):
+                        completion = getattr(self, index_attr).get(
+                            value[len(prefix):]
+                        )
+                        if completion is not None:
+                            suggestion = prefix + completion
+                        break
+
+        cache[value] = suggestion
+        if len(cache) > self._cache_maxsize:
+            cache.popitem(last=False)
+
+        self._last_value = raw_value
+        self._last_result = suggestion
+        return suggestion
 
 class MemoryCommandDropdown:
     """Factory for creating dropdown items for memory commands"""
@@ -368,6 +514,60 @@ class FeiChatApp(App):
         self.config = Config()
         self.tool_registry = self.setup_tools()
         self.assistant = self.setup_assistant(api_key, model, provider)
+        # Bounds the worker threads used for blocking memory handler calls
+        self._memory_sem = asyncio.Semaphore(2)
+        # One connector for the whole session, with auto-start enabled
+        self._memdir = MemdirConnector(auto_start=True)
+        # (timestamp, result) of the last server status query; start/stop
+        # invalidate it so the next poll is authoritative
+        self._status_cache: Optional[tuple] = None
+        # Chronological log of mounted messages, so features like /mem save
+        # can iterate a plain list instead of running a DOM query
+        self._message_log: List[ChatMessage] = []
+        # Nesting depth of _loading_scope; the indicator is only touched
+        # when this crosses zero
+        self._loading_depth = 0
+        # O(1) memory subcommand dispatch table
+        self._subcommand_handlers = {
+            "help": self._mem_help,
+            "list": self._mem_list,
+            "search": self._mem_search,
+            "view": self._mem_view,
+            "save": self._mem_save,
+            "tag": self._mem_tag,
+            "server": self._mem_server,
+        }
+
+    @asynccontextmanager
+    async def _loading_scope(self):
+        """
+        Show the loading indicator for the duration of a command
+
+        Nested scopes are coalesced through a depth counter, so the
+        is_loading reactive and the indicator display are each written once
+        per outermost scope instead of toggling per call.
+        """
+        if self._loading_depth == 0:
+            self.is_loading = True
+            self._loading.display = True
+        self._loading_depth += 1
+        try:
+            yield
+        finally:
+            self._loading_depth -= 1
+            if self._loading_depth == 0:
+                self.is_loading = False
+                self._loading.display = False
+
+    async def _call_memory_handler(self, handler, *args):
+        """
+        Run a blocking memory handler on a worker thread
+
+        The Memdir handlers do synchronous HTTP; running them inline would
+        stall the event loop and freeze input and rendering for the duration.
+        """
+        async with self._memory_sem:
+            return await asyncio.to_thread(handler, *args)
         
     def setup_tools(self) -> ToolRegistry:
         """Set up tool registry with all tools"""
@@ -410,9 +610,14 @@ class FeiChatApp(App):
     
     def on_mount(self) -> None:
         """When app is mounted"""
+        # Resolve frequently used widgets once instead of re-querying the
+        # widget tree on every command
+        self._loading = self.query_one(LoadingIndicator)
+        self._chat_container = self.query_one("#chat-container", ChatContainer)
+        self._input = self.query_one("#message-input", Input)
+
         # Hide loading indicator initially
-        loading = self.query_one(LoadingIndicator)
-        loading.display = False
+        self._loading.display = False
         
         # Add welcome message
         welcome = f"""# 🐉 Fei Code Assistant 🐉
@@ -428,8 +633,9 @@ Type your message and press Enter to send."""
         # Schedule the welcome message to be added
         asyncio.create_task(self.add_assistant_message(welcome))
         
-        # Set up dynamic tag suggestions based on available memory tags
-        self._update_memory_suggestions()
+        # Set up dynamic tag suggestions in the background; Memdir I/O must
+        # not delay the first frame
+        asyncio.create_task(self._update_memory_suggestions())
     
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle submitted input"""
@@ -444,16 +650,28 @@ Type your message and press Enter to send."""
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press"""
         if event.button.id == "send-button":
-            input_widget = self.query_one(AutoComplete)
-            message_input = input_widget.input
+            message_input = self._input
             if message_input.value.strip():
                 self.handle_user_message(message_input.value)
                 message_input.value = ""
     
-    def action_clear(self) -> None:
+    async def action_clear(self) -> None:
         """Clear the chat history"""
-        chat_container = self.query_one("#chat-container")
-        chat_container.remove_children()
+        # Swap in a fresh container instead of unmounting every message one
+        # by one; two layout passes (insert + remove) regardless of chat size
+        old = self._chat_container
+        parent = old.parent
+        siblings = list(parent.children)
+        index = siblings.index(old)
+        anchor = siblings[index + 1] if index + 1 < len(siblings) else None
+        await old.remove()
+        new = ChatContainer(id="chat-container")
+        if anchor is not None:
+            await parent.mount(new, before=anchor)
+        else:
+            await parent.mount(new)
+        self._chat_container = new
+        self._message_log.clear()
         self.assistant.reset_conversation()
         
         # Add welcome message back
@@ -462,36 +680,38 @@ Type your message and press Enter to send."""
         
     def action_search_memories(self) -> None:
         """Open memory search prompt"""
-        input_widget = self.query_one(AutoComplete)
-        message_input = input_widget.input
+        message_input = self._input
         message_input.value = "/mem search "
         message_input.focus()
         
-    def _update_memory_suggestions(self) -> None:
+    async def _update_memory_suggestions(self) -> None:
         """Update memory suggestions with available tags and folders"""
         try:
             # Try to get memory tags from memdir connector
-            from fei.tools.memory_tools import memory_list_handler, memory_search_handler
-            
+
             # Get a list of unique tags from memories
-            search_result = memory_search_handler({"query": "#", "limit": 100})
-            tags = set()
-            
+            search_result = await self._call_memory_handler(
+                memory_search_handler, {"query": "#", "limit": 100}
+            )
+
             if not isinstance(search_result, dict) or "error" in search_result:
                 return
-                
-            for memory in search_result.get("results", []):
-                memory_tags = memory.get("tags", "")
-                if memory_tags:
-                    tags.update([tag.strip() for tag in memory_tags.split(",")])
-            
+
+            # One joined split over all tag headers instead of a split and
+            # comprehension per memory
+            joined = ",".join(
+                memory.get("tags", "")
+                for memory in search_result.get("results", [])
+            )
+            tags = {tag.strip() for tag in joined.split(",") if tag.strip()}
+
             # Get list of folders
-            list_result = memory_list_handler({})
+            list_result = await self._call_memory_handler(memory_list_handler, {})
             folders = set()
-            
+
             if not isinstance(list_result, dict) or "error" in list_result:
                 return
-                
+
             # Extract folder names from memories
             for memory in list_result.get("memories", []):
                 folder = memory.get("folder", "")
@@ -500,19 +720,19 @@ Type your message and press Enter to send."""
             
             # Update the suggester with the discovered tags and folders
             # Find the memory command suggester
-            input_widget = self.query_one("#message-input", Input)
+            input_widget = self._input
             if hasattr(input_widget, "suggester") and isinstance(input_widget.suggester, MemoryCommandSuggester):
                 suggester = input_widget.suggester
                 
-                # Update tag suggestions
+                # Update tag suggestions (rebuilds the tag trie)
                 if tags:
-                    suggester.tag_suggestions = list(tags)
-                
-                # Update folder suggestions
+                    suggester.update_tag_suggestions(list(tags))
+
+                # Update folder suggestions (rebuilds the folder trie)
                 if folders:
-                    suggester.folder_suggestions = list(folders)
+                    suggester.update_folder_suggestions(list(folders))
         except Exception as e:
-            logger.error(f"Error updating memory suggestions: {e}")
+            logger.error("Error updating memory suggestions: %s", e)
             
     def on_auto_complete_selected(self, event) -> None:
         """Handle autocomplete selection event"""
@@ -528,7 +748,7 @@ Type your message and press Enter to send."""
         # Commands that need more input get the cursor placed at the right position
         elif selected_value in ["/mem search", "/mem view", "/mem save", "/mem tag"]:
             # Add a space and focus the input to let the user add the rest
-            input_widget = self.query_one("#message-input", Input)
+            input_widget = self._input
             input_widget.value = f"{selected_value} "
             input_widget.focus()
             input_widget.cursor_position = len(input_widget.value)
@@ -541,7 +761,7 @@ Type your message and press Enter to send."""
             return
             
         if message.lower() == "clear":
-            self.action_clear()
+            asyncio.create_task(self.action_clear())
             return
         
         # Check for memory commands
@@ -558,7 +778,7 @@ Type your message and press Enter to send."""
     async def handle_memory_command(self, command: str) -> None:
         """
         Handle memory-related commands
-        
+
         Supported commands:
         - /mem search <query> - Search memories
         - /mem list - List memories
@@ -568,26 +788,24 @@ Type your message and press Enter to send."""
         """
         # Add command to chat as user message
         await self.add_user_message(command)
-        
+
         # Process command
         parts = command.split(maxsplit=2)
-        
+
         if len(parts) < 2:
-            await self.add_assistant_message("Invalid memory command. Use '/mem help' for available commands.")
+            await self.add_assistant_message(_ERR_INVALID_MEM_CMD)
             return
-        
+
         subcommand = parts[1].lower()
-        
+
         # Check if Memdir server is running before executing commands (except help)
         if subcommand != "help":
             try:
-                from fei.tools.memdir_connector import MemdirConnector
-                connector = MemdirConnector()
-                # Try to start the server automatically - always start it regardless of check
-                # Create connector with auto-start enabled
-                connector = MemdirConnector(auto_start=True)
-                result = connector.start_server_command()
-                
+                # Try to start the server automatically - always start it
+                # regardless of check; the shared connector keeps its pooled
+                # connections alive across commands
+                result = await self._call_memory_handler(self._memdir.start_server_command)
+
                 # Always continue with the command, as the actual memory operations will
                 # now handle server auto-start internally
                 if result["status"] != "already_running":
@@ -595,12 +813,21 @@ Type your message and press Enter to send."""
                         f"**Starting Memdir server:** {result['message']}"
                     )
             except Exception as e:
-                await self.add_assistant_message(f"**Error checking Memdir connection:** {str(e)}")
+                await self.add_assistant_message(_fmt_err("Error checking Memdir connection", str(e)))
                 return
-        
-        # Show help
-        if subcommand == "help":
-            help_text = """**Memory System Commands:**
+
+        # O(1) dict dispatch; unknown subcommands fall through to the
+        # shared invalid-command message
+        handler = self._subcommand_handlers.get(subcommand, self._mem_unknown)
+        await handler(parts)
+
+    async def _mem_unknown(self, parts: List[str]) -> None:
+        """Report an unrecognized or incomplete memory command"""
+        await self.add_assistant_message(f"Unknown memory command: '{parts[1].lower()}'. Use '/mem help' for available commands.")
+
+    async def _mem_help(self, parts: List[str]) -> None:
+        """Show memory command help"""
+        help_text = """**Memory System Commands:**
 
 - `/mem search <query>` - Search memories with query syntax
 - `/mem list [folder]` - List memories in a folder
@@ -620,129 +847,104 @@ Type your message and press Enter to send."""
 - `/mem save "Important Python Tips"` - Save the conversation with a subject
 - `/mem server start` - Start the server if it's not running
 """
-            await self.add_assistant_message(help_text)
-            return
-            
-        # List memories
-        if subcommand == "list":
-            folder = parts[2] if len(parts) > 2 else ""
-            
-            try:
-                # Show loading indicator
-                loading = self.query_one(LoadingIndicator)
-                self.is_loading = True
-                loading.display = True
-                
-                # Call the memory_list tool handler directly
-                from fei.tools.memory_tools import memory_list_handler
-                result = memory_list_handler({"folder": folder, "limit": 10})
-                
+        await self.add_assistant_message(help_text)
+
+    async def _mem_list(self, parts: List[str]) -> None:
+        """List memories in a folder"""
+        folder = parts[2] if len(parts) > 2 else ""
+
+        try:
+            async with self._loading_scope():
+                result = await self._call_memory_handler(memory_list_handler, {"folder": folder, "limit": 10})
+
                 if "error" in result:
                     await self.add_assistant_message(f"**Error:** {result['error']}")
                     # Since we're already auto-starting in the handler directly,
                     # we don't need to do another attempt here
                     return
-                
+
                 # Format the output
                 count = result.get("count", 0)
                 memories = result.get("memories", [])
-                
+
                 if count == 0:
                     output = f"No memories found in {folder or 'root folder'}."
                 else:
-                    output = f"**Memories in {folder or 'root folder'}:**\n\n"
-                    for memory in memories:
-                        subject = memory.get("subject", "No subject")
-                        memory_id = memory.get("id", "")
-                        tags = memory.get("tags", "")
-                        tags_display = f" [tags: {tags}]" if tags else ""
-                        
-                        output += f"- **{subject}**{tags_display} (ID: `{memory_id}`)\n"
-                    
+                    # Build lines in a list and join once; linear in count
+                    lines = [
+                        f"- **{memory.get('subject', 'No subject')}**"
+                        f"{' [tags: ' + memory['tags'] + ']' if memory.get('tags') else ''}"
+                        f" (ID: `{memory.get('id', '')}`)"
+                        for memory in memories[:10]
+                    ]
+                    output = f"**Memories in {folder or 'root folder'}:**\n\n" + "\n".join(lines) + "\n"
+
                     if count > 10:
                         output += f"\n*Showing 10 of {count} memories. Use more specific search to narrow results.*"
-                
+
                 await self.add_assistant_message(output)
-                
-            except Exception as e:
-                await self.add_assistant_message(f"**Error listing memories:** {str(e)}")
-            finally:
-                # Hide loading indicator
-                self.is_loading = False
-                loading.display = False
-            
+
+        except Exception as e:
+            await self.add_assistant_message(_fmt_err("Error listing memories", str(e)))
+
+    async def _mem_search(self, parts: List[str]) -> None:
+        """Search memories with a query"""
+        if len(parts) < 3:
+            await self._mem_unknown(parts)
             return
-            
-        # Search memories
-        if subcommand == "search" and len(parts) > 2:
-            query = parts[2]
-            
-            try:
-                # Show loading indicator
-                loading = self.query_one(LoadingIndicator)
-                self.is_loading = True
-                loading.display = True
-                
-                # Call the memory_search tool handler directly
-                from fei.tools.memory_tools import memory_search_handler
-                result = memory_search_handler({"query": query, "limit": 10})
-                
+        query = parts[2]
+
+        try:
+            async with self._loading_scope():
+                result = await self._call_memory_handler(memory_search_handler, {"query": query, "limit": 10})
+
                 if "error" in result:
                     await self.add_assistant_message(f"**Error:** {result['error']}")
                     # Since we're already auto-starting in the handler directly,
                     # we don't need to do another attempt here
                     return
-                
+
                 # Format the output
                 count = result.get("count", 0)
                 memories = result.get("results", [])
-                
+
                 if count == 0:
                     output = f"No memories found matching query: '{query}'."
                 else:
-                    output = f"**Search results for '{query}':**\n\n"
-                    for memory in memories:
-                        subject = memory.get("subject", "No subject")
-                        memory_id = memory.get("id", "")
-                        tags = memory.get("tags", "")
-                        tags_display = f" [tags: {tags}]" if tags else ""
-                        
-                        output += f"- **{subject}**{tags_display} (ID: `{memory_id}`)\n"
-                    
+                    # Build lines in a list and join once; linear in count
+                    lines = [
+                        f"- **{memory.get('subject', 'No subject')}**"
+                        f"{' [tags: ' + memory['tags'] + ']' if memory.get('tags') else ''}"
+                        f" (ID: `{memory.get('id', '')}`)"
+                        for memory in memories[:10]
+                    ]
+                    output = f"**Search results for '{query}':**\n\n" + "\n".join(lines) + "\n"
+
                     if count > 10:
                         output += f"\n*Showing 10 of {count} results. Use more specific search to narrow results.*"
-                
+
                 await self.add_assistant_message(output)
-                
-            except Exception as e:
-                await self.add_assistant_message(f"**Error searching memories:** {str(e)}")
-            finally:
-                # Hide loading indicator
-                self.is_loading = False
-                loading.display = False
-            
+
+        except Exception as e:
+            await self.add_assistant_message(_fmt_err("Error searching memories", str(e)))
+
+    async def _mem_view(self, parts: List[str]) -> None:
+        """View a specific memory"""
+        if len(parts) < 3:
+            await self._mem_unknown(parts)
             return
-            
-        # View a memory
-        if subcommand == "view" and len(parts) > 2:
-            memory_id = parts[2]
-            
-            try:
-                # Show loading indicator
-                loading = self.query_one(LoadingIndicator)
-                self.is_loading = True
-                loading.display = True
-                
-                # Call the memory_view tool handler directly
-                from fei.tools.memory_tools import memory_view_handler
-                result = memory_view_handler({"memory_id": memory_id})
-                
+        memory_id = parts[2]
+
+        try:
+            async with self._loading_scope():
+                result = await self._call_memory_handler(memory_view_handler, {"memory_id": memory_id})
+
                 if "error" in result:
                     await self.add_assistant_message(f"**Error:** {result['error']}")
                     # Since we're already auto-starting in the handler directly,
                     # we don't need to do another attempt here
                     return
-                
+
                 # Format the output
                 subject = result.get("subject", "No subject")
                 content = result.get("content", "")
@@ -750,9 +952,9 @@ Type your message and press Enter to send."""
                 date = result.get("date", "")
                 priority = result.get("priority", "")
                 status = result.get("status", "")
-                
+
                 output = f"# {subject}\n\n"
-                
+
                 if tags:
                     output += f"**Tags:** {tags}\n"
                 if date:
@@ -761,285 +963,316 @@ Type your message and press Enter to send."""
                     output += f"**Priority:** {priority}\n"
                 if status:
                     output += f"**Status:** {status}\n"
-                
+
                 output += f"\n---\n\n{content}"
-                
+
                 await self.add_assistant_message(output)
-                
-            except Exception as e:
-                await self.add_assistant_message(f"**Error viewing memory:** {str(e)}")
-            finally:
-                # Hide loading indicator
-                self.is_loading = False
-                loading.display = False
-            
+
+        except Exception as e:
+            await self.add_assistant_message(_fmt_err("Error viewing memory", str(e)))
+
+    async def _mem_save(self, parts: List[str]) -> None:
+        """Save the conversation as a memory"""
+        if len(parts) < 3:
+            await self._mem_unknown(parts)
             return
-            
-        # Save conversation as a memory
-        if subcommand == "save" and len(parts) > 2:
-            subject = parts[2]
-            
-            # Collect conversation history
-            chat_container = self.query_one("#chat-container")
-            messages = chat_container.query("ChatMessage")
-            
-            conversation = ""
-            for message in messages:
-                sender = message.sender
-                content = message.content
-                conversation += f"**{sender.capitalize()}:** {content}\n\n"
-            
-            try:
-                # Show loading indicator
-                loading = self.query_one(LoadingIndicator)
-                self.is_loading = True
-                loading.display = True
-                
-                # Call the memory_create tool handler directly
-                from fei.tools.memory_tools import memory_create_handler
-                result = memory_create_handler({
+        subject = parts[2]
+
+        # Collect conversation history from the message log; building the
+        # parts in a list keeps the concatenation linear in chat length
+        conversation = "".join(
+            f"**{m.sender.capitalize()}:** {m.content}\n\n"
+            for m in self._message_log
+        )
+
+        try:
+            async with self._loading_scope():
+                result = await self._call_memory_handler(memory_create_handler, {
                     "subject": subject,
                     "content": conversation,
                     "tags": "conversation,fei",
                     "priority": "medium"
                 })
-                
+
                 if "error" in result:
                     await self.add_assistant_message(f"**Error:** {result['error']}")
                     # Since we're already auto-starting in the handler directly,
                     # we don't need to do another attempt here
                     return
-                
+
                 memory_id = result.get("memory_id", "")
                 await self.add_assistant_message(f"Conversation saved as memory with subject: '{subject}'\nMemory ID: `{memory_id}`")
-                
-            except Exception as e:
-                await self.add_assistant_message(f"**Error saving memory:** {str(e)}")
-            finally:
-                # Hide loading indicator
-                self.is_loading = False
-                loading.display = False
-            
+
+        except Exception as e:
+            await self.add_assistant_message(_fmt_err("Error saving memory", str(e)))
+
+    async def _mem_tag(self, parts: List[str]) -> None:
+        """Search memories by tag"""
+        if len(parts) < 3:
+            await self._mem_unknown(parts)
             return
-            
-        # Search by tag
-        if subcommand == "tag" and len(parts) > 2:
-            tag = parts[2]
-            
-            try:
-                # Show loading indicator
-                loading = self.query_one(LoadingIndicator)
-                self.is_loading = True
-                loading.display = True
-                
-                # Call the memory_search_by_tag tool handler directly
-                from fei.tools.memory_tools import memory_search_by_tag_handler
-                result = memory_search_by_tag_handler({"tag": tag})
-                
+        tag = parts[2]
+
+        try:
+            async with self._loading_scope():
+                result = await self._call_memory_handler(memory_search_by_tag_handler, {"tag": tag})
+
                 if "error" in result:
                     await self.add_assistant_message(f"**Error:** {result['error']}")
                     # Since we're already auto-starting in the handler directly,
                     # we don't need to do another attempt here
                     return
-                
+
                 # Format the output
                 count = result.get("count", 0)
                 memories = result.get("results", [])
-                
+
                 if count == 0:
-                    output = f"No memories found with tag: '{tag}'."
+                    output = _NO_MEMS_TAG_TMPL % tag
                 else:
-                    output = f"**Memories with tag '{tag}':**\n\n"
-                    for memory in memories:
-                        subject = memory.get("subject", "No subject")
-                        memory_id = memory.get("id", "")
-                        
-                        output += f"- **{subject}** (ID: `{memory_id}`)\n"
-                    
+                    # Build lines in a list and join once, formatting only
+                    # the 10 entries actually shown
+                    lines = [
+                        f"- **{memory.get('subject', 'No subject')}** (ID: `{memory.get('id', '')}`)"
+                        for memory in memories[:10]
+                    ]
+                    output = f"**Memories with tag '{tag}':**\n\n" + "\n".join(lines) + "\n"
+
                     if count > 10:
                         output += f"\n*Showing 10 of {count} results. Use more specific search to narrow results.*"
-                
+
                 await self.add_assistant_message(output)
-                
+
+        except Exception as e:
+            await self.add_assistant_message(_fmt_err("Error searching by tag", str(e)))
+
+    # Table of server subcommands: handler, error prefix, and a map from
+    # result status to message formatter (None is the fallback). One helper
+    # body replaces three near-identical branches.
+    _SERVER_CMDS = {
+        "start": (memdir_server_start_handler, "Error starting server", {
+            "started": lambda r: f"**{r.get('message', 'Server started successfully')}**",
+            "already_running": lambda r: f"**{r.get('message', 'Server is already running')}**",
+            None: lambda r: f"**Error:** {r.get('message', 'Failed to start server')}",
+        }),
+        "stop": (memdir_server_stop_handler, "Error stopping server", {
+            "stopped": lambda r: f"**{r.get('message', 'Server stopped successfully')}**",
+            "not_running": lambda r: f"**{r.get('message', 'Server is not running')}**",
+            None: lambda r: f"**Error:** {r.get('message', 'Failed to stop server')}",
+        }),
+        "status": (memdir_server_status_handler, "Error checking server status", {
+            "running": lambda r: f"**Memdir Server Status:** Running on port {r.get('port', 'unknown')}",
+            "stopped": lambda r: _STATUS_STOPPED,
+            None: lambda r: f"**Memdir Server Status:** {r.get('message', 'Unknown')}",
+        }),
+    }
+
+    # How long a status result may be served from cache, in seconds
+    _STATUS_TTL = 2.0
+
+    async def _server_status(self) -> Dict[str, Any]:
+        """
+        Return the server status, cached for a short TTL
+
+        Status only changes when the server is started or stopped, and
+        those paths invalidate the cache, so repeated polls inside the
+        window skip the network round-trip entirely.
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < self._STATUS_TTL:
+            return self._status_cache[1]
+
+        result = await self._call_memory_handler(memdir_server_status_handler, {})
+        self._status_cache = (time.monotonic(), result)
+        return result
+
+    async def _run_server_cmd(self, handler, error_prefix, messages) -> None:
+        """Run one server command and report its result"""
+        async with self._loading_scope():
+            try:
+                if handler is memdir_server_status_handler:
+                    result = await self._server_status()
+                else:
+                    result = await self._call_memory_handler(handler, {})
+                    # start/stop change what the status cache reflects
+                    self._status_cache = None
+                formatter = messages.get(result.get("status"), messages[None])
+                await self.add_assistant_message(formatter(result))
             except Exception as e:
-                await self.add_assistant_message(f"**Error searching by tag:** {str(e)}")
-            finally:
-                # Hide loading indicator
-                self.is_loading = False
-                loading.display = False
-            
+                await self.add_assistant_message(_fmt_err(error_prefix, str(e)))
+
+    async def _mem_server(self, parts: List[str]) -> None:
+        """Start, stop or query the Memdir server"""
+        if len(parts) < 3:
+            await self.add_assistant_message(_ERR_MISSING_SERVER_CMD)
             return
-        
-        # Server commands
-        if subcommand == "server":
-            if len(parts) < 3:
-                await self.add_assistant_message("**Error:** Missing server command (start, stop, or status)")
-                return
-                
-            server_cmd = parts[2].lower()
-            
-            if server_cmd == "start":
-                # Try to start the server
-                from fei.tools.memdir_connector import MemdirConnector
-                from fei.tools.memory_tools import memdir_server_start_handler
-                
-                # Show loading indicator
-                loading = self.query_one(LoadingIndicator)
-                self.is_loading = True
-                loading.display = True
-                
-                try:
-                    result = memdir_server_start_handler({})
-                    
-                    if result.get("status") == "started":
-                        await self.add_assistant_message(f"**{result.get('message', 'Server started successfully')}**")
-                    elif result.get("status") == "already_running":
-                        await self.add_assistant_message(f"**{result.get('message', 'Server is already running')}**")
-                    else:
-                        await self.add_assistant_message(f"**Error:** {result.get('message', 'Failed to start server')}")
-                except Exception as e:
-                    await self.add_assistant_message(f"**Error starting server:** {str(e)}")
-                finally:
-                    # Hide loading indicator
-                    self.is_loading = False
-                    loading.display = False
-                
-                return
-                
-            elif server_cmd == "stop":
-                # Try to stop the server
-                from fei.tools.memdir_connector import MemdirConnector
-                from fei.tools.memory_tools import memdir_server_stop_handler
-                
-                # Show loading indicator
-                loading = self.query_one(LoadingIndicator)
-                self.is_loading = True
-                loading.display = True
-                
-                try:
-                    result = memdir_server_stop_handler({})
-                    
-                    if result.get("status") == "stopped":
-                        await self.add_assistant_message(f"**{result.get('message', 'Server stopped successfully')}**")
-                    elif result.get("status") == "not_running":
-                        await self.add_assistant_message(f"**{result.get('message', 'Server is not running')}**")
-                    else:
-                        await self.add_assistant_message(f"**Error:** {result.get('message', 'Failed to stop server')}")
-                except Exception as e:
-                    await self.add_assistant_message(f"**Error stopping server:** {str(e)}")
-                finally:
-                    # Hide loading indicator
-                    self.is_loading = False
-                    loading.display = False
-                
-                return
-                
-            elif server_cmd == "status":
-                # Check server status
-                from fei.tools.memdir_connector import MemdirConnector
-                from fei.tools.memory_tools import memdir_server_status_handler
-                
-                # Show loading indicator
-                loading = self.query_one(LoadingIndicator)
-                self.is_loading = True
-                loading.display = True
-                
-                try:
-                    result = memdir_server_status_handler({})
-                    status = result.get("status", "unknown")
-                    
-                    if status == "running":
-                        port = result.get("port", "unknown")
-                        await self.add_assistant_message(f"**Memdir Server Status:** Running on port {port}")
-                    elif status == "stopped":
-                        await self.add_assistant_message("**Memdir Server Status:** Stopped (not running)")
-                    else:
-                        await self.add_assistant_message(f"**Memdir Server Status:** {result.get('message', 'Unknown')}")
-                except Exception as e:
-                    await self.add_assistant_message(f"**Error checking server status:** {str(e)}")
-                finally:
-                    # Hide loading indicator
-                    self.is_loading = False
-                    loading.display = False
-                
-                return
-            else:
-                await self.add_assistant_message(f"**Unknown server command:** '{server_cmd}'. Use 'start', 'stop', or 'status'.")
-                return
-                
-        # Unknown subcommand
-        await self.add_assistant_message(f"Unknown memory command: '{subcommand}'. Use '/mem help' for available commands.")
+
+        server_cmd = parts[2].lower()
+        entry = self._SERVER_CMDS.get(server_cmd)
+        if entry is None:
+            await self.add_assistant_message(f"**Unknown server command:** '{server_cmd}'. Use 'start', 'stop', or 'status'.")
+            return
+
+        await self._run_server_cmd(*entry)
     
     async def add_user_message(self, message: str) -> None:
         """Add a user message to the chat"""
+        # A new user turn finalizes any assistant message still streaming
+        if self._message_log and self._message_log[-1].streaming:
+            self._message_log[-1].streaming = False
         try:
-            chat_container = self.query_one("#chat-container")
-            await chat_container.add_message(message, sender="user")
+            self._message_log.append(
+                await self._chat_container.add_message(message, sender="user")
+            )
         except Exception as e:
             # If there's an error adding the message, fall back to direct mount
-            logger.error(f"Error adding user message: {e}")
+            logger.error("Error adding user message: %s", e)
             try:
-                container = self.query_one("#chat-container")
                 message_widget = ChatMessage(message, sender="user")
-                await container.mount(message_widget)
+                await self._chat_container.mount(message_widget)
+                self._message_log.append(message_widget)
             except Exception as inner_e:
-                logger.error(f"Critical error displaying message: {inner_e}")
+                logger.error("Critical error displaying message: %s", inner_e)
     
-    async def add_assistant_message(self, message: str) -> None:
-        """Add an assistant message to the chat"""
+    async def add_assistant_message(self, message: str, streaming: bool = False) -> None:
+        """
+        Add an assistant message to the chat
+
+        With streaming=True, consecutive calls append to the same widget
+        instead of mounting a new one per chunk, so incremental output costs
+        one in-place refresh rather than a mount and layout pass.
+        """
+        last = self._message_log[-1] if self._message_log else None
+        if last is not None and last.sender == "assistant" and last.streaming:
+            last.append(message)
+            if not streaming:
+                last.streaming = False
+            return
+
         try:
-            chat_container = self.query_one("#chat-container")
-            await chat_container.add_message(message, sender="assistant")
+            if len(message) >= _THREAD_RENDER_MIN:
+                # Parsing a multi-KB markdown reply is CPU-bound; build the
+                # widget off the loop so the spinner keeps animating
+                widget = await asyncio.to_thread(
+                    ChatMessage, message, "assistant", streaming
+                )
+            else:
+                widget = ChatMessage(message, sender="assistant", streaming=streaming)
+            self._message_log.append(self._chat_container.queue_widget(widget))
         except Exception as e:
             # If there's an error adding the message, fall back to direct mount
-            logger.error(f"Error adding assistant message: {e}")
+            logger.error("Error adding assistant message: %s", e)
             try:
-                container = self.query_one("#chat-container")
-                message_widget = ChatMessage(message, sender="assistant")
-                await container.mount(message_widget)
+                message_widget = ChatMessage(message, sender="assistant", streaming=streaming)
+                await self._chat_container.mount(message_widget)
+                self._message_log.append(message_widget)
             except Exception as inner_e:
-                logger.error(f"Critical error displaying message: {inner_e}")
+                logger.error("Critical error displaying message: %s", inner_e)
     
+    async def _stream_response(self, stream) -> None:
+        """
+        Render a streaming reply incrementally
+
+        Chunks are coalesced on a short interval so a fast token stream
+        costs a handful of re-renders per second instead of one per token.
+        """
+        buffer: List[str] = []
+        started = False
+        flush_due = 0.0
+        async for chunk in stream:
+            if not chunk:
+                continue
+            buffer.append(chunk)
+            now = time.monotonic()
+            if not started or now >= flush_due:
+                await self.add_assistant_message("".join(buffer), streaming=True)
+                buffer.clear()
+                started = True
+                flush_due = now + 0.03
+        # Final flush also closes the streaming message
+        await self.add_assistant_message("".join(buffer), streaming=False)
+
     async def process_with_assistant(self, message: str) -> None:
         """Process a message with the assistant"""
-        # Show loading indicator
-        loading = self.query_one(LoadingIndicator)
-        self.is_loading = True
-        loading.display = True  # Show loading indicator
-        
-        try:
-            # Get response from assistant
-            response = await self.assistant.chat(message)
-            
-            if response is None:
-                response = "Sorry, I couldn't generate a response. Please try again."
-                
-            # Add assistant message to chat
-            await self.add_assistant_message(response)
-            
-        except Exception as e:
-            # Handle error
-            error_message = f"**Error:** {str(e)}"
-            await self.add_assistant_message(error_message)
-            logger.error(f"Assistant error: {e}", exc_info=True)
-            
-        finally:
-            # Hide loading indicator
-            self.is_loading = False
-            loading.display = False  # Hide loading indicator
-            
-            # Refocus input
-            self.query_one("#message-input").focus()
+        async with self._loading_scope():
+            try:
+                # Stream the reply into the chat when the assistant exposes
+                # a chunk generator; otherwise fall back to one buffered
+                # response per turn
+                chat_stream = getattr(self.assistant, "chat_stream", None)
+                if chat_stream is not None:
+                    await self._stream_response(chat_stream(message))
+                    return
+
+                response = await self.assistant.chat(message)
 
-def parse_args() -> argparse.Namespace:
+                if response is None:
+                    response = "Sorry, I couldn't generate a response. Please try again."
+
+                # Add assistant message to chat
+                await self.add_assistant_message(response)
+
+            except Exception as e:
+                # Handle error
+                await self.add_assistant_message(_fmt_err("Error", str(e)))
+                # Tracebacks are expensive to format; only pay for them in debug
+                logger.error("Assistant error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+
+            finally:
+                # Refocus input
+                self._input.focus()
+
+# Flags taking a value, mapped to their namespace attribute
+_VALUE_FLAGS = {"--api-key": "api_key", "--model": "model", "--provider": "provider"}
+_PROVIDER_CHOICES = ("anthropic", "openai", "groq")
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the four known flags without building an argparse tree
+
+    Returns None when anything unexpected (including --help) is seen so
+    the argparse fallback can produce proper usage and error messages.
+    """
+    args = SimpleNamespace(api_key=None, model=None, provider="anthropic", debug=False)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--debug":
+            args.debug = True
+            i += 1
+            continue
+        name, eq, value = arg.partition("=")
+        dest = _VALUE_FLAGS.get(name)
+        if dest is None:
+            return None
+        if not eq:
+            i += 1
+            if i >= len(argv):
+                return None
+            value = argv[i]
+        if name == "--provider" and value not in _PROVIDER_CHOICES:
+            return None
+        setattr(args, dest, value)
+        i += 1
+    return args
+
+
+def parse_args() -> Any:
     """Parse command-line arguments"""
+    args = _fast_parse(sys.argv[1:])
+    if args is not None:
+        return args
+
+    # Unknown flag or --help: pay the argparse import only on this path
+    import argparse
     parser = argparse.ArgumentParser(description="Fei Code Assistant - Modern Textual Chat Interface")
-    
+
     parser.add_argument("--api-key", help="API key (defaults to provider-specific environment variable)")
     parser.add_argument("--model", help="Model to use (defaults to provider's default model)")
     parser.add_argument("--provider", default="anthropic", choices=["anthropic", "openai", "groq"], help="LLM provider to use")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-    
+
     return parser.parse_args()
 
 def main() -> None:
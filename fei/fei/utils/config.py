@@ -8,18 +8,152 @@ and permission checks.
 
 import os
 import json
-import configparser
+import atexit
+import functools
 import stat
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Type, TypeVar, cast, Tuple
-import uuid
+from secrets import token_hex
+from collections.abc import Mapping
 from enum import Enum
-from dotenv import load_dotenv
 
 from fei.utils.logging import get_logger
 
+# orjson parses the list/dict config blobs several times faster than the
+# stdlib; fall back silently when it isn't installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = get_logger(__name__)
 
+
+def _parse_env(path: str) -> None:
+    """
+    Load KEY=VALUE pairs from a .env file into os.environ
+
+    Existing environment variables are never overridden. This covers the
+    dotenv syntax the project uses (comments, blank lines, optional
+    "export " prefix, single/double quotes) with one buffered read and no
+    regex machinery.
+
+    Args:
+        path: Path to the .env file
+    """
+    with open(path, 'rb', buffering=65536) as f:
+        data = f.read()
+
+    for line in data.decode('utf-8', errors='replace').splitlines():
+        line = line.strip()
+
+        if not line or line.startswith('#'):
+            continue
+
+        if line.startswith('export '):
+            line = line[7:].lstrip()
+
+        key, sep, value = line.partition('=')
+        if not sep:
+            continue
+
+        key = key.strip()
+        if not key or key in os.environ:
+            continue
+
+        value = value.strip()
+        if value[:1] in ('"', "'"):
+            # Quoted values end at the matching quote; anything after it
+            # (typically an inline comment) is dropped, and a '#' inside
+            # the quotes is kept
+            end = value.find(value[0], 1)
+            if end != -1:
+                value = value[1:end]
+        else:
+            # Unquoted values may carry an inline comment; strip it the
+            # way dotenv did
+            hash_pos = value.find(' #')
+            if hash_pos != -1:
+                value = value[:hash_pos].rstrip()
+
+        os.environ[key] = value
+
+
+def _read_ini(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a flat INI file into a dict of sections
+
+    Covers the subset this project writes: [section] headers, key = value
+    lines, comments, blanks and indented continuation lines for
+    multi-line values. Option names are lowercased the way configparser
+    did; there is no interpolation.
+
+    Args:
+        path: Path to the INI file
+
+    Returns:
+        Dict of section -> option -> raw string value
+    """
+    data: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    last_key: Optional[str] = None
+
+    with open(path, 'r', buffering=65536) as f:
+        for raw in f:
+            line = raw.strip()
+
+            # Indented lines continue the previous value, the way
+            # configparser round-trips embedded newlines
+            if raw[0] in ' \t' and current is not None and last_key is not None:
+                current[last_key] += "\n" + line
+                continue
+
+            if not line:
+                last_key = None
+                continue
+
+            if line[0] in '#;':
+                continue
+
+            if line[0] == '[' and line[-1] == ']':
+                current = data.setdefault(line[1:-1].strip(), {})
+                last_key = None
+                continue
+
+            if current is None:
+                continue
+
+            key, sep, value = line.partition('=')
+            if sep:
+                last_key = key.strip().lower()
+                current[last_key] = value.strip()
+
+    return data
+
+
+def _write_ini(data: Dict[str, Dict[str, str]]) -> str:
+    """
+    Serialize a dict of sections to INI text in configparser's format
+
+    Multi-line values are written with tab-indented continuation lines
+    so _read_ini (and configparser) can round-trip them.
+
+    Args:
+        data: Dict of section -> option -> raw string value
+
+    Returns:
+        INI file content
+    """
+    return "\n".join(
+        f"[{section}]\n" + "".join(
+            "{} = {}\n".format(key, str(value).replace("\n", "\n\t"))
+            for key, value in options.items()
+        )
+        for section, options in data.items()
+    )
+
+
 # Type variable for config value validation
 T = TypeVar('T')
 
@@ -101,159 +235,269 @@ class ConfigValue:
         self.min_value = min_value
         self.max_value = max_value
         self.choices = choices
+
+        # Candidate env var names, compiled in at schema-build time so the
+        # get() hot path never re-derives them
+        self.env_keys: Tuple[str, ...] = ()
     
     def validate(self, value: Any) -> Tuple[bool, Optional[str], Any]:
         """
         Validate and convert a value
-        
+
         Args:
             value: Value to validate
-            
+
         Returns:
             Tuple of (is_valid, error_message, converted_value)
         """
         # Handle None
         if value is None:
             return True, None, self.default
-        
-        # Convert and validate based on type
+
+        # Strings (the configparser/environ case) are hashable and repeat
+        # across gets, so route them through the memoized converter
+        convert = _convert_cached if isinstance(value, str) else _convert_value
+        is_valid, error, converted = convert(self.value_type, value)
+
+        if not is_valid:
+            return is_valid, error, converted
+
+        # Bounds and choices differ per ConfigValue, so check them outside
+        # the shared conversion cache
         if self.value_type == ConfigValueType.STRING:
-            if not isinstance(value, str):
-                try:
-                    value = str(value)
-                except Exception:
-                    return False, f"Cannot convert {value} to string", None
-            
-            if self.choices and value not in self.choices:
+            if self.choices and converted not in self.choices:
                 return False, f"Value must be one of: {', '.join(self.choices)}", None
-                
-            return True, None, value
-            
-        elif self.value_type == ConfigValueType.INTEGER:
-            if not isinstance(value, int):
-                try:
-                    value = int(value)
-                except Exception:
-                    return False, f"Cannot convert {value} to integer", None
-            
-            if self.min_value is not None and value < self.min_value:
-                return False, f"Value must be at least {self.min_value}", None
-                
-            if self.max_value is not None and value > self.max_value:
-                return False, f"Value must be at most {self.max_value}", None
-                
-            return True, None, value
-            
-        elif self.value_type == ConfigValueType.FLOAT:
-            if not isinstance(value, (int, float)):
-                try:
-                    value = float(value)
-                except Exception:
-                    return False, f"Cannot convert {value} to float", None
-            
-            if self.min_value is not None and value < self.min_value:
+        elif self.value_type in (ConfigValueType.INTEGER, ConfigValueType.FLOAT):
+            if self.min_value is not None and converted < self.min_value:
                 return False, f"Value must be at least {self.min_value}", None
-                
-            if self.max_value is not None and value > self.max_value:
+
+            if self.max_value is not None and converted > self.max_value:
                 return False, f"Value must be at most {self.max_value}", None
-                
-            return True, None, value
-            
-        elif self.value_type == ConfigValueType.BOOLEAN:
-            if isinstance(value, bool):
-                return True, None, value
-                
-            if isinstance(value, str):
-                if value.lower() in ["true", "yes", "1", "on"]:
-                    return True, None, True
-                elif value.lower() in ["false", "no", "0", "off"]:
-                    return True, None, False
-                    
-            return False, f"Cannot convert {value} to boolean", None
-            
-        elif self.value_type == ConfigValueType.LIST:
-            if isinstance(value, str):
-                try:
-                    value = json.loads(value)
-                except Exception:
-                    try:
-                        value = value.split(",")
-                    except Exception:
-                        return False, f"Cannot convert {value} to list", None
-            
-            if not isinstance(value, list):
-                return False, f"Cannot convert {value} to list", None
-                
+
+        return True, None, converted
+
+
+def _convert_value(value_type: ConfigValueType, value: Any) -> Tuple[bool, Optional[str], Any]:
+    """
+    Convert a value to a configured type
+
+    Args:
+        value_type: Target configuration type
+        value: Value to convert
+
+    Returns:
+        Tuple of (is_valid, error_message, converted_value)
+    """
+    if value_type == ConfigValueType.STRING:
+        if not isinstance(value, str):
+            try:
+                value = str(value)
+            except Exception:
+                return False, f"Cannot convert {value} to string", None
+
+        return True, None, value
+
+    elif value_type == ConfigValueType.INTEGER:
+        if not isinstance(value, int):
+            try:
+                value = int(value)
+            except Exception:
+                return False, f"Cannot convert {value} to integer", None
+
+        return True, None, value
+
+    elif value_type == ConfigValueType.FLOAT:
+        if not isinstance(value, (int, float)):
+            try:
+                value = float(value)
+            except Exception:
+                return False, f"Cannot convert {value} to float", None
+
+        return True, None, value
+
+    elif value_type == ConfigValueType.BOOLEAN:
+        if isinstance(value, bool):
             return True, None, value
-            
-        elif self.value_type == ConfigValueType.DICT:
-            if isinstance(value, str):
+
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in _TRUE:
+                return True, None, True
+            elif lowered in _FALSE:
+                return True, None, False
+
+        return False, f"Cannot convert {value} to boolean", None
+
+    elif value_type == ConfigValueType.LIST:
+        if isinstance(value, str):
+            try:
+                value = _loads(value)
+            except Exception:
                 try:
-                    value = json.loads(value)
+                    value = value.split(",")
                 except Exception:
-                    return False, f"Cannot convert {value} to dictionary", None
-            
-            if not isinstance(value, dict):
+                    return False, f"Cannot convert {value} to list", None
+
+        if not isinstance(value, list):
+            return False, f"Cannot convert {value} to list", None
+
+        return True, None, value
+
+    elif value_type == ConfigValueType.DICT:
+        if isinstance(value, str):
+            try:
+                value = _loads(value)
+            except Exception:
                 return False, f"Cannot convert {value} to dictionary", None
-                
-            return True, None, value
-            
-        # Unknown type
-        return False, f"Unknown value type: {self.value_type}", None
+
+        if not isinstance(value, dict):
+            return False, f"Cannot convert {value} to dictionary", None
+
+        return True, None, value
+
+    # Unknown type
+    return False, f"Unknown value type: {value_type}", None
+
+
+# Raw strings repeat across gets (every read of mcp.servers re-parses the
+# same JSON blob); memoize their conversion so repeats are a dict lookup
+_convert_cached = functools.lru_cache(maxsize=512)(_convert_value)
+
+
+def _env_keys_for(section: str, option: str) -> Tuple[str, ...]:
+    """
+    Compute candidate environment variable names for a config key
+
+    Args:
+        section: Config section
+        option: Config option
+
+    Returns:
+        Env var names in priority order
+    """
+    # Standard format: FEI_SECTION_OPTION
+    keys = [f"FEI_{section.upper()}_{option.upper()}"]
+
+    # Special cases for API keys
+    if option == 'api_key' and section in ('anthropic', 'openai', 'groq', 'brave'):
+        # Provider specific format (e.g., ANTHROPIC_API_KEY)
+        keys.append(f"{section.upper()}_API_KEY")
+
+        # Generic LLM_API_KEY as fallback for LLM providers
+        if section != 'brave':
+            keys.append("LLM_API_KEY")
+
+    return tuple(keys)
+
+
+class LazySectionSchema(Mapping):
+    """
+    Section schema materializing ConfigValue objects on first access
+
+    Most processes only ever read a couple of options, so the remaining
+    ConfigValue construction is deferred until someone asks for it.
+    """
+
+    def __init__(self, section: str, params: Dict[str, Dict[str, Any]]):
+        """
+        Initialize section schema
+
+        Args:
+            section: Section name
+            params: Raw option definitions from CONFIG_SCHEMA
+        """
+        self._section = section
+        self._params = params
+        self._values: Dict[str, ConfigValue] = {}
+
+    def __getitem__(self, option: str) -> ConfigValue:
+        value = self._values.get(option)
+
+        if value is None:
+            params = self._params[option]
+            value = ConfigValue(
+                value_type=params["type"],
+                default=params.get("default"),
+                secret=params.get("secret", False),
+                min_value=params.get("min"),
+                max_value=params.get("max"),
+                choices=params.get("choices")
+            )
+            value.env_keys = _env_keys_for(self._section, option)
+            self._values[option] = value
+
+        return value
+
+    def __contains__(self, option: object) -> bool:
+        return option in self._params
+
+    def __iter__(self):
+        return iter(self._params)
+
+    def __len__(self) -> int:
+        return len(self._params)
 
 
 # Create config schema
-def create_config_schema() -> Dict[str, Dict[str, ConfigValue]]:
+def create_config_schema() -> Dict[str, LazySectionSchema]:
     """
     Create config schema from static definition
-    
+
     Returns:
-        Dict of section -> option -> ConfigValue
+        Dict of section -> lazy option -> ConfigValue mapping
     """
-    schema = {}
-    
-    for section, options in CONFIG_SCHEMA.items():
-        schema[section] = {}
-        
-        for option, params in options.items():
-            value_type = params["type"]
-            default = params.get("default")
-            secret = params.get("secret", False)
-            min_value = params.get("min")
-            max_value = params.get("max")
-            choices = params.get("choices")
-            
-            schema[section][option] = ConfigValue(
-                value_type=value_type,
-                default=default,
-                secret=secret,
-                min_value=min_value,
-                max_value=max_value,
-                choices=choices
-            )
-    
-    return schema
+    return {
+        section: LazySectionSchema(section, options)
+        for section, options in CONFIG_SCHEMA.items()
+    }
+
+# Default .env locations, resolved once at import; abspath-normalized so
+# aliases of the same file (./.env vs /abs/.env) are parsed only once
+_DEFAULT_ENV_LOCATIONS = tuple(dict.fromkeys(
+    os.path.abspath(p) for p in (
+        os.path.join(os.getcwd(), '.env'),
+        os.path.expanduser('~/.env'),
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env'),
+    )
+))
+
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
+
+# Accepted spellings for boolean config values
+_TRUE = frozenset({"true", "yes", "1", "on"})
+_FALSE = frozenset({"false", "no", "0", "off"})
+
+# Inodes already checked by _secure_path this process; repeat
+# constructions skip the stat/chmod syscalls for them
+_SECURED: set = set()
+
+# Parsed config files keyed by (abspath, mtime_ns, size) so repeated
+# constructions within a process skip the regex-heavy configparser read
+_PARSED_CACHE: Dict[Tuple[str, int, int], Dict[str, Dict[str, str]]] = {}
 
 # Global config instance
 _config = None
 
-def get_config(config_path: Optional[str] = None, env_file: Optional[str] = None) -> 'Config':
+def get_config(config_path: Optional[str] = None, env_file: Optional[str] = None,
+               force_reload: bool = False) -> 'Config':
     """
     Get the global configuration instance
     
     Args:
         config_path: Path to configuration file
         env_file: Path to .env file
+        force_reload: Re-scan .env locations even if already loaded
         
     Returns:
         Configuration instance
     """
     global _config
     if _config is None:
-        _config = Config(config_path, env_file)
-    elif config_path or env_file:
+        _config = Config(config_path, env_file, force_reload=force_reload)
+    elif config_path or env_file or force_reload:
         # Reload config if paths are specified
-        _config = Config(config_path, env_file)
+        _config = Config(config_path, env_file, force_reload=force_reload)
     
     return _config
 
@@ -267,29 +511,52 @@ def reset_config() -> None:
 class Config:
     """Configuration manager for Fei code assistant"""
     
-    def __init__(self, config_path: Optional[str] = None, env_file: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, env_file: Optional[str] = None,
+                 force_reload: bool = False):
         """
         Initialize configuration with secure defaults
         
         Args:
             config_path: Path to configuration file
             env_file: Path to .env file
+            force_reload: Re-scan default .env locations even if a prior
+                construction (or parent process) already loaded them
         """
         # Set up schema
         self.schema = create_config_schema()
-        
+        self._force_reload = force_reload
+
         # Load environment variables from .env file
         self.env_file = env_file or os.path.join(os.getcwd(), '.env')
         self._load_env_file()
         
-        # Load INI configuration
-        self.config = configparser.ConfigParser()
+        # Load INI configuration (plain dict of sections; the flat schema
+        # needs none of configparser's interpolation machinery)
+        self.config: Dict[str, Dict[str, str]] = {}
         self.config_path = config_path or os.path.expanduser("~/.fei.ini")
+
+        # Converted values by (section, option), filled by set() so reads
+        # of freshly-written keys skip validation entirely
+        self._cvt_cache: Dict[Tuple[str, str], Any] = {}
+
         self.load_config()
-        
-        # Session ID for tracking
-        self.session_id = str(uuid.uuid4())
+
+        # Writes are debounced: set()/delete() mark the config dirty and
+        # the file is rewritten once, at flush() or process exit
+        self._dirty = False
+        atexit.register(self.flush)
+
+        # Session ID for tracking, generated on first access
+        self._session_id: Optional[str] = None
     
+    @property
+    def session_id(self) -> str:
+        """Session ID for tracking (generated lazily)"""
+        if self._session_id is None:
+            self._session_id = token_hex(16)
+
+        return self._session_id
+
     def _secure_path(self, path: str) -> None:
         """
         Ensure a file path has secure permissions
@@ -306,16 +573,24 @@ class Config:
             
             # If file exists, check permissions
             if path_obj.exists():
-                mode = path_obj.stat().st_mode
-                
+                st = path_obj.stat()
+
+                # Skip files already secured this process
+                key = (st.st_dev, st.st_ino)
+                if key in _SECURED:
+                    return
+
                 # Unset group and other write permissions
+                mode = st.st_mode
                 if mode & (stat.S_IWGRP | stat.S_IWOTH):
                     new_mode = mode & ~(stat.S_IWGRP | stat.S_IWOTH)
                     os.chmod(path, new_mode)
-                    logger.debug(f"Secured permissions for {path}")
+                    logger.debug("Secured permissions for %s", path)
+
+                _SECURED.add(key)
         
         except (OSError, PermissionError) as e:
-            logger.warning(f"Could not secure permissions for {path}: {e}")
+            logger.warning("Could not secure permissions for %s: %s", path, e)
     
     def _load_env_file(self) -> None:
         """
@@ -337,28 +612,33 @@ class Config:
             self._secure_path(self.env_file)
             
             try:
-                load_dotenv(self.env_file, override=False)  # Don't override existing env vars
-                logger.debug(f"Loaded environment variables from {self.env_file}")
+                _parse_env(self.env_file)  # Doesn't override existing env vars
+                logger.debug("Loaded environment variables from %s", self.env_file)
             except Exception as e:
-                logger.error(f"Error loading .env file {self.env_file}: {e}")
-        
-        # If not found, try default locations
-        default_locations = [
-            os.path.join(os.getcwd(), '.env'),
-            os.path.expanduser('~/.env'),
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env')
-        ]
-        
-        for env_path in default_locations:
-            if env_path != self.env_file and os.path.exists(env_path):
-                # Check file permissions
-                self._secure_path(env_path)
-                
-                try:
-                    load_dotenv(env_path, override=False)
-                    logger.debug(f"Loaded environment variables from {env_path}")
-                except Exception as e:
-                    logger.error(f"Error loading .env file {env_path}: {e}")
+                logger.error("Error loading .env file %s: %s", self.env_file, e)
+
+        # Scan the precompiled default locations, once per process tree:
+        # the FEI_ENV_LOADED sentinel is inherited by forked workers so
+        # they skip the stat/parse round. An explicit env_file above is
+        # always honored regardless.
+        if "FEI_ENV_LOADED" not in os.environ or self._force_reload:
+            # Parse each distinct path once
+            seen = {os.path.abspath(self.env_file)}
+
+            for env_path in _DEFAULT_ENV_LOCATIONS:
+                if env_path not in seen and os.path.exists(env_path):
+                    seen.add(env_path)
+
+                    # Check file permissions
+                    self._secure_path(env_path)
+
+                    try:
+                        _parse_env(env_path)
+                        logger.debug("Loaded environment variables from %s", env_path)
+                    except Exception as e:
+                        logger.error("Error loading .env file %s: %s", env_path, e)
+
+            os.environ.setdefault("FEI_ENV_LOADED", "1")
         
         # Restore any manually set environment variables
         for key, value in current_env.items():
@@ -368,15 +648,33 @@ class Config:
         """
         Load configuration from file securely
         """
+        self._cvt_cache.clear()
+        self.config = {}
+
         if os.path.exists(self.config_path):
             # Check file permissions
             self._secure_path(self.config_path)
-            
+
             try:
-                self.config.read(self.config_path)
-                logger.debug(f"Loaded config from {self.config_path}")
+                # Reuse the parsed result while the file is unchanged
+                st = os.stat(self.config_path)
+                cache_key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+                cached = _PARSED_CACHE.get(cache_key)
+
+                if cached is not None:
+                    self.config = {section: dict(options) for section, options in cached.items()}
+                else:
+                    self.config = _read_ini(self.config_path)
+
+                    # Store a snapshot so later mutations of self.config
+                    # don't leak into the cache
+                    _PARSED_CACHE[cache_key] = {
+                        section: dict(options) for section, options in self.config.items()
+                    }
+
+                logger.debug("Loaded config from %s", self.config_path)
             except Exception as e:
-                logger.error(f"Error loading config: {e}")
+                logger.error("Error loading config: %s", e)
         
         # Ensure all schema sections exist
         for section in self.schema:
@@ -390,19 +688,30 @@ class Config:
         try:
             # Create parent directory if it doesn't exist
             os.makedirs(os.path.dirname(os.path.abspath(self.config_path)), exist_ok=True)
-            
-            # Write config
-            with open(self.config_path, 'w') as f:
-                self.config.write(f)
-            
+
+            # Write config to a sibling file, then replace atomically so a
+            # crash mid-write can't truncate the existing config
+            tmp_path = self.config_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(_write_ini(self.config))
+            os.replace(tmp_path, self.config_path)
+
             # Secure file permissions
             self._secure_path(self.config_path)
-            
-            logger.debug(f"Saved config to {self.config_path}")
+
+            self._dirty = False
+            logger.debug("Saved config to %s", self.config_path)
         except Exception as e:
-            logger.error(f"Error saving config: {e}")
+            logger.error("Error saving config: %s", e)
             raise ConfigSecurityError(f"Could not save configuration: {e}")
     
+    def flush(self) -> None:
+        """
+        Write pending configuration changes to disk, if any
+        """
+        if self._dirty:
+            self.save_config()
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value by key with type validation
@@ -436,12 +745,18 @@ class Config:
                 if is_valid:
                     return converted
                 
-                logger.warning(f"Environment value for {key} is invalid: {error}")
+                logger.warning("Environment value for %s is invalid: %s", key, error)
                 # Fall back to config file or default
             else:
                 # No schema info, return as is
                 return env_value
-        
+
+        # Values written through set() were already validated; reuse the
+        # converted result instead of re-validating the stored string
+        cached = self._cvt_cache.get((section, option), _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         # Check config file
         if section in self.config and option in self.config[section]:
             value = self.config[section][option]
@@ -454,7 +769,7 @@ class Config:
                 if is_valid:
                     return converted
                 
-                logger.warning(f"Config value for {key} is invalid: {error}")
+                logger.warning("Config value for %s is invalid: %s", key, error)
                 # Fall back to default
             else:
                 # No schema info, return as is
@@ -478,28 +793,23 @@ class Config:
         Returns:
             Environment value or None
         """
-        # Standard format: FEI_SECTION_OPTION
-        env_key = f"FEI_{section.upper()}_{option.upper()}"
-        env_value = os.environ.get(env_key)
-        if env_value is not None:
-            return env_value
-            
-        # Special cases for API keys
-        if section in ['anthropic', 'openai', 'groq', 'brave'] and option == 'api_key':
-            # Provider specific format (e.g., ANTHROPIC_API_KEY)
-            env_value = os.environ.get(f"{section.upper()}_API_KEY")
+        sv_map = self.schema.get(section)
+        if sv_map is not None and option in sv_map:
+            keys = sv_map[option].env_keys
+        else:
+            # Non-schema keys keep the dynamic naming convention
+            keys = (f"FEI_{section.upper()}_{option.upper()}",)
+
+        environ_get = os.environ.get
+        for env_key in keys:
+            env_value = environ_get(env_key)
             if env_value is not None:
+                if env_key == "LLM_API_KEY":
+                    logger.debug("Using LLM_API_KEY for %s", section)
                 return env_value
-                
-            # Try generic LLM_API_KEY as fallback for LLM providers
-            if section in ['anthropic', 'openai', 'groq']:
-                env_value = os.environ.get("LLM_API_KEY")
-                if env_value is not None:
-                    logger.debug(f"Using LLM_API_KEY for {section}")
-                    return env_value
-        
+
         return None
-    
+
     def set(self, key: str, value: Any) -> None:
         """
         Set a configuration value by key with validation
@@ -542,9 +852,10 @@ class Config:
         
         # Set value
         self.config[section][option] = str_value
-        
-        # Save config
-        self.save_config()
+        self._cvt_cache[(section, option)] = value
+
+        # Save on flush or exit
+        self._dirty = True
     
     def delete(self, key: str) -> bool:
         """
@@ -571,10 +882,11 @@ class Config:
         
         # Delete key
         del self.config[section][option]
-        
-        # Save config
-        self.save_config()
-        
+        self._cvt_cache.pop((section, option), None)
+
+        # Save on flush or exit
+        self._dirty = True
+
         return True
     
     def get_section(self, section: str) -> Dict[str, Any]:
@@ -589,24 +901,28 @@ class Config:
         """
         if section not in self.config:
             return {}
-        
+
+        # Resolve the section's schema map once instead of re-checking
+        # membership per option
+        sv_map = self.schema.get(section)
+
+        if sv_map is None:
+            # No schema info, use values as-is
+            return dict(self.config[section])
+
         result = {}
-        
+
         # Convert all values according to schema if available
         for option, value in self.config[section].items():
-            if section in self.schema and option in self.schema[section]:
-                config_value = self.schema[section][option]
-                is_valid, _, converted = config_value.validate(value)
-                
-                if is_valid:
-                    result[option] = converted
-                else:
-                    # Use as-is if validation fails
-                    result[option] = value
+            if option in sv_map:
+                is_valid, _, converted = sv_map[option].validate(value)
+
+                # Use as-is if validation fails
+                result[option] = converted if is_valid else value
             else:
                 # No schema info, use as-is
                 result[option] = value
-        
+
         return result
     
     def get_all(self) -> Dict[str, Dict[str, Any]]:
@@ -616,12 +932,7 @@ class Config:
         Returns:
             Dictionary of all values (converted to appropriate types)
         """
-        result = {}
-        
-        for section in self.config.sections():
-            result[section] = self.get_section(section)
-        
-        return result
+        return {section: self.get_section(section) for section in self.config}
     
     def get_typed(self, key: str, expected_type: Type[T], default: Optional[T] = None) -> T:
         """
@@ -647,50 +958,96 @@ class Config:
                     value = float(value)
                 elif expected_type == bool:
                     if isinstance(value, str):
-                        value = value.lower() in ["true", "yes", "1", "on"]
+                        value = value.strip().lower() in _TRUE
                     else:
                         value = bool(value)
                 elif expected_type == str:
                     value = str(value)
                 elif expected_type == list:
                     if isinstance(value, str):
+                        # Raw strings come from env vars or non-schema keys:
+                        # accept JSON first, then fall back to CSV
                         try:
-                            value = json.loads(value)
-                        except json.JSONDecodeError:
-                            value = value.split(",")
+                            value = _loads(value)
+                        except ValueError:
+                            value = [item.strip() for item in value.split(",")]
+                        if not isinstance(value, list):
+                            raise TypeError
                     else:
                         value = list(value)
                 elif expected_type == dict:
                     if isinstance(value, str):
-                        value = json.loads(value)
+                        value = _loads(value)
+                        if not isinstance(value, dict):
+                            raise TypeError
                     else:
                         value = dict(value)
                 else:
                     # Can't convert, use default
-                    logger.warning(f"Cannot convert {key} to {expected_type.__name__}")
+                    logger.warning("Cannot convert %s to %s", key, expected_type.__name__)
                     return default if default is not None else cast(T, None)
-            except (ValueError, TypeError, json.JSONDecodeError):
+            except (ValueError, TypeError):
                 # Conversion failed, use default
-                logger.warning(f"Cannot convert {key} to {expected_type.__name__}")
+                logger.warning("Cannot convert %s to %s", key, expected_type.__name__)
                 return default if default is not None else cast(T, None)
         
         return value if value is not None else (default if default is not None else cast(T, None))
     
     def get_string(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get a string configuration value"""
-        return self.get_typed(key, str, default)
+        value = self.get(key, default)
+
+        if value is None:
+            return default
+
+        return value if isinstance(value, str) else str(value)
     
     def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
         """Get an integer configuration value"""
-        return self.get_typed(key, int, default)
+        value = self.get(key, default)
+
+        if value is None:
+            return default
+
+        if isinstance(value, int):
+            return value
+
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            logger.warning("Cannot convert %s to int", key)
+            return default
     
     def get_float(self, key: str, default: Optional[float] = None) -> Optional[float]:
         """Get a float configuration value"""
-        return self.get_typed(key, float, default)
+        value = self.get(key, default)
+
+        if value is None:
+            return default
+
+        if isinstance(value, float):
+            return value
+
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            logger.warning("Cannot convert %s to float", key)
+            return default
     
     def get_bool(self, key: str, default: Optional[bool] = None) -> Optional[bool]:
         """Get a boolean configuration value"""
-        return self.get_typed(key, bool, default)
+        value = self.get(key, default)
+
+        if value is None:
+            return default
+
+        if isinstance(value, bool):
+            return value
+
+        if isinstance(value, str):
+            return value.strip().lower() in _TRUE
+
+        return bool(value)
     
     def get_list(self, key: str, default: Optional[List[Any]] = None) -> Optional[List[Any]]:
         """Get a list configuration value"""
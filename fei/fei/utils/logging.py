@@ -6,9 +6,13 @@ Logging utilities for Fei code assistant
 import os
 import logging
 import logging.handlers
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+# Shared formatter; one allocation for all loggers instead of one per call
+_FMT = logging.Formatter("[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s")
+
 def setup_logging(level: Optional[str] = None, log_file: Optional[str] = None) -> None:
     """
     Set up logging for the application
@@ -57,63 +61,69 @@ def setup_logging(level: Optional[str] = None, log_file: Optional[str] = None) -
 
 # Configure logging
 _loggers = {}
+_LOGGER_LOCK = threading.Lock()
 
 def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Get a configured logger instance
-    
+
     Args:
         name: Logger name
         level: Logging level
-        
+
     Returns:
         Configured logger
     """
-    if name in _loggers:
-        return _loggers[name]
-    
-    # Create logger
-    logger = logging.getLogger(name)
-    
-    # Set level
-    if level is not None:
-        logger.setLevel(level)
-    else:
-        # Default to INFO, but check environment variable
-        env_level = os.environ.get("FEI_LOG_LEVEL", "INFO").upper()
-        numeric_level = getattr(logging, env_level, logging.INFO)
-        logger.setLevel(numeric_level)
-    
-    # Check if handlers already exist
-    if logger.handlers:
-        _loggers[name] = logger
+    # Fast path: already configured (dict reads are atomic in CPython)
+    logger = _loggers.get(name)
+    if logger is not None:
         return logger
-    
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(
-        logging.Formatter("[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s")
-    )
-    logger.addHandler(console_handler)
-    
-    # Create file handler if enabled
-    log_file = os.environ.get("FEI_LOG_FILE")
-    if log_file:
-        # Create log directory if it doesn't exist
-        log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-        
-        # Create file handler with rotation
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=10*1024*1024, backupCount=5
-        )
-        file_handler.setFormatter(
-            logging.Formatter("[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s")
-        )
-        logger.addHandler(file_handler)
-    
-    # Store logger in cache
-    _loggers[name] = logger
-    
+
+    # Serialize setup so concurrent first calls (threaded test runners,
+    # parallel imports) can't double-attach handlers
+    with _LOGGER_LOCK:
+        logger = _loggers.get(name)
+        if logger is not None:
+            return logger
+
+        # Create logger
+        logger = logging.getLogger(name)
+
+        # Set level
+        if level is not None:
+            logger.setLevel(level)
+        else:
+            # Default to INFO, but check environment variable
+            env_level = os.environ.get("FEI_LOG_LEVEL", "INFO").upper()
+            numeric_level = getattr(logging, env_level, logging.INFO)
+            logger.setLevel(numeric_level)
+
+        # Check if handlers already exist
+        if logger.handlers:
+            _loggers[name] = logger
+            return logger
+
+        # Create console handler
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(_FMT)
+        logger.addHandler(console_handler)
+
+        # Create file handler if enabled
+        log_file = os.environ.get("FEI_LOG_FILE")
+        if log_file:
+            # Create log directory if it doesn't exist
+            log_dir = os.path.dirname(log_file)
+            if log_dir and not os.path.exists(log_dir):
+                os.makedirs(log_dir, exist_ok=True)
+
+            # Create file handler with rotation
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=10*1024*1024, backupCount=5
+            )
+            file_handler.setFormatter(_FMT)
+            logger.addHandler(file_handler)
+
+        # Store logger in cache
+        _loggers[name] = logger
+
     return logger
\ No newline at end of file
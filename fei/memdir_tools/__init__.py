@@ -1,7 +1,7 @@
 """
 Memdir Tools - Memory Management based on Maildir approach
 
-A suite of tools for managing memories in a hierarchical structure similar to 
+A suite of tools for managing memories in a hierarchical structure similar to
 Maildir email storage, with support for metadata, flags, and categorization.
 
 This package provides:
@@ -12,39 +12,60 @@ This package provides:
 - Distributed memory system (Memorychain)
 """
 
+import importlib
+
 __version__ = "0.3.0"  # Updated for Memorychain support
 
-# Make key modules accessible from the package
-from .utils import (
-    ensure_memdir_structure,
-    get_memdir_folders,
-    save_memory,
-    list_memories,
-    move_memory,
-    update_memory_flags
-)
-
-from .search import (
-    SearchQuery,
-    search_memories,
-    parse_search_args
-)
-
-# Import Memorychain components
-try:
-    from .memorychain import (
-        MemoryBlock,
-        MemoryChain,
-        MemorychainNode,
-        DEFAULT_PORT
-    )
-except ImportError:
-    # Required libraries may not be installed
-    pass
-
-# Import server module for access to Flask app
-try:
-    from . import server
-except ImportError:
-    # Flask may not be installed
-    pass
\ No newline at end of file
+# Re-exported names and the submodule providing each. Resolved lazily via
+# PEP 562 so importing the package doesn't drag in Flask (server) or the
+# Memorychain stack for CLIs that only touch the Maildir utilities.
+_LAZY_ATTRS = {
+    "ensure_memdir_structure": ".utils",
+    "get_memdir_folders": ".utils",
+    "save_memory": ".utils",
+    "list_memories": ".utils",
+    "move_memory": ".utils",
+    "update_memory_flags": ".utils",
+    "SearchQuery": ".search",
+    "search_memories": ".search",
+    "parse_search_args": ".search",
+    "MemoryBlock": ".memorychain",
+    "MemoryChain": ".memorychain",
+    "MemorychainNode": ".memorychain",
+    "DEFAULT_PORT": ".memorychain",
+}
+
+
+def __getattr__(name):
+    """Resolve re-exported names on first access"""
+    if name == "server":
+        # Submodule kept accessible as memdir_tools.server
+        try:
+            module = importlib.import_module(".server", __name__)
+        except ImportError:
+            # Optional stack (Flask) missing; keep the old "attribute
+            # not there" contract for hasattr/getattr probing
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+        globals()[name] = module
+        return module
+
+    target = _LAZY_ATTRS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        obj = getattr(importlib.import_module(target, __name__), name)
+    except ImportError:
+        # Memorychain (and its dependencies) may be absent; the eager
+        # try/except import used to leave these names undefined
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | {"server"})
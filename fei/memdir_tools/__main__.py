@@ -4,88 +4,119 @@ Main entry point for Memdir memory management tools
 """
 
 import sys
-import argparse
-from memdir_tools.cli import main as cli_main
-from memdir_tools.utils import ensure_memdir_structure
+
+# Command sets, built once at import so dispatch is an O(1) membership
+# test instead of a per-invocation list scan
+_ARCHIVER_CMDS = frozenset({
+    "maintenance", "archive", "cleanup", "empty-trash", "retention", "update-status",
+})
+_FOLDER_CMDS = frozenset({
+    "create-folder", "rename-folder", "delete-folder", "move-folder",
+    "copy-folder", "list-folders", "folder-stats", "make-symlinks", "bulk-tag",
+})
+_SEARCH_CMDS = frozenset({"search", "find", "advanced-search"})
+_SPECIAL_COMMANDS = frozenset({"init-samples", "run-filters"}) | _ARCHIVER_CMDS | _FOLDER_CMDS | _SEARCH_CMDS
+
+# Resolved dispatch targets by (module, attr), so long-lived processes
+# (test harnesses, REPLs) calling main() repeatedly skip the import
+# machinery after the first dispatch
+_handler_cache = {}
+
+
+def _resolve(module_path, attr):
+    """Import and cache a dispatch target on first use"""
+    key = (module_path, attr)
+    fn = _handler_cache.get(key)
+
+    if fn is None:
+        import importlib
+
+        fn = _handler_cache[key] = getattr(importlib.import_module(module_path), attr)
+
+    return fn
+
+
+def _run_init_samples():
+    """Create sample memories in the Memdir structure"""
+    create_samples = _resolve("memdir_tools.create_samples", "create_samples")
+
+    # Parse count argument if provided; the C-level digit check keeps
+    # exception machinery off the happy path
+    count = 20
+    if len(sys.argv) > 2:
+        arg = sys.argv[2]
+        if arg.isdigit() or (arg.startswith("-") and arg[1:].isdigit()):
+            count = int(arg)
+
+    # Create samples
+    create_samples(count)
+    print("Sample memories have been created in the Memdir structure.")
+
+
+def _run_filters():
+    """Run memory filters over the remaining arguments"""
+    # argparse is only needed on this branch; keep it off the hot
+    # startup path of every other command
+    import argparse
+
+    run_filters = _resolve("memdir_tools.filter", "run_filters")
+
+    # Parse arguments for run-filters
+    parser = argparse.ArgumentParser(description="Run memory filters")
+    parser.add_argument("--dry-run", action="store_true", help="Simulate actions without applying them")
+    parser.add_argument("--all", action="store_true", help="Process all memories (not just new)")
+
+    # Parse only the remaining arguments
+    args = parser.parse_args(sys.argv[2:])
+
+    # Run filters
+    run_filters(dry_run=args.dry_run)
+
+
+def _run_archiver():
+    """Run archiver commands (the command name feeds its subparsers)"""
+    _resolve("memdir_tools.archiver", "main")(argv=sys.argv[1:])
+
+
+def _run_folders():
+    """Run folder management commands (command name kept, as above)"""
+    _resolve("memdir_tools.folders", "main")(argv=sys.argv[1:])
+
+
+def _run_search():
+    """Run the search tool on the arguments after the command name"""
+    _resolve("memdir_tools.search", "main")(argv=sys.argv[2:])
+
+
+# Special command dispatch: one dict lookup picks the handler, and each
+# handler lazily imports exactly the submodule it needs
+_DISPATCH = {
+    "init-samples": _run_init_samples,
+    "run-filters": _run_filters,
+}
+_DISPATCH.update((cmd, _run_archiver) for cmd in _ARCHIVER_CMDS)
+_DISPATCH.update((cmd, _run_folders) for cmd in _FOLDER_CMDS)
+_DISPATCH.update((cmd, _run_search) for cmd in _SEARCH_CMDS)
+
 
 def main():
     """Main entry point"""
+    # Help/version just print and exit; don't touch the filesystem first
+    if len(sys.argv) >= 2 and sys.argv[1] in ("--help", "-h", "--version", "-V"):
+        _resolve("memdir_tools.cli", "main")()
+        return
+
     # Ensure the Memdir structure exists
-    ensure_memdir_structure()
-    
-    # Define special commands
-    special_commands = ["init-samples", "run-filters", "maintenance", "archive", 
-                        "cleanup", "empty-trash", "retention", "update-status",
-                        "create-folder", "rename-folder", "delete-folder", "move-folder",
-                        "copy-folder", "list-folders", "folder-stats", "make-symlinks", "bulk-tag",
-                        "search", "find", "advanced-search"]
-    
-    # Dispatch to CLI main if no special commands
-    if len(sys.argv) < 2 or sys.argv[1] not in special_commands:
-        cli_main()
+    _resolve("memdir_tools.utils", "ensure_memdir_structure")()
+
+    # Dispatch to CLI main if no special commands; the cli module (and
+    # everything it drags in) is only imported when actually invoked
+    handler = _DISPATCH.get(sys.argv[1]) if len(sys.argv) >= 2 else None
+    if handler is None:
+        _resolve("memdir_tools.cli", "main")()
         return
-    
-    # Sample generation commands
-    if sys.argv[1] == "init-samples":
-        from memdir_tools.create_samples import create_samples
-        
-        # Parse count argument if provided
-        count = 20
-        if len(sys.argv) > 2:
-            try:
-                count = int(sys.argv[2])
-            except ValueError:
-                pass
-                
-        # Create samples
-        create_samples(count)
-        print(f"Sample memories have been created in the Memdir structure.")
-    
-    # Filter commands
-    elif sys.argv[1] == "run-filters":
-        from memdir_tools.filter import run_filters
-        
-        # Parse arguments for run-filters
-        parser = argparse.ArgumentParser(description="Run memory filters")
-        parser.add_argument("--dry-run", action="store_true", help="Simulate actions without applying them")
-        parser.add_argument("--all", action="store_true", help="Process all memories (not just new)")
-        
-        # Parse only the remaining arguments
-        args = parser.parse_args(sys.argv[2:])
-        
-        # Run filters
-        run_filters(dry_run=args.dry_run)
-    
-    # Archiver commands
-    elif sys.argv[1] in ["maintenance", "archive", "cleanup", "empty-trash", "retention", "update-status"]:
-        from memdir_tools.archiver import main as archiver_main
-        
-        # Replace the command name in sys.argv
-        sys.argv[0] = "memdir_tools.archiver"
-        
-        # Run the archiver
-        archiver_main()
-        
-    # Folder management commands
-    elif sys.argv[1] in ["create-folder", "rename-folder", "delete-folder", "move-folder", 
-                     "copy-folder", "list-folders", "folder-stats", "make-symlinks", "bulk-tag"]:
-        from memdir_tools.folders import main as folders_main
-        
-        # Replace the command name in sys.argv
-        sys.argv[0] = "memdir_tools.folders"
-        
-        # Run the folder manager
-        folders_main()
-        
-    # Search commands
-    elif sys.argv[1] in ["search", "find", "advanced-search"]:
-        from memdir_tools.search import main as search_main
-        
-        # Replace the command arguments
-        sys.argv = [sys.argv[0]] + sys.argv[2:]
-        
-        # Run the search tool
-        search_main()
+
+    return handler()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
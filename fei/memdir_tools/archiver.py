@@ -640,11 +640,12 @@ class MemoryArchiver:
 
 
 # Command-line interface
-def parse_args():
+def parse_args(argv=None):
     """Parse command-line arguments"""
     import argparse
     
-    parser = argparse.ArgumentParser(description="Memory Archiving and Maintenance System")
+    parser = argparse.ArgumentParser(prog="memdir_tools.archiver",
+                                     description="Memory Archiving and Maintenance System")
     parser.add_argument("--dry-run", action="store_true", help="Simulate actions without applying them")
     
     subparsers = parser.add_subparsers(dest="command", help="Command")
@@ -677,11 +678,11 @@ def parse_args():
     # Maintenance command
     maintenance_parser = subparsers.add_parser("maintenance", help="Run full maintenance process")
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
     
-def main():
+def main(argv=None):
     """Main entry point"""
-    args = parse_args()
+    args = parse_args(argv)
     
     # Create archiver
     archiver = MemoryArchiver()
@@ -383,12 +383,13 @@ For complete documentation:
 
 def main() -> None:
     """Main entry point"""
+    # Parse arguments first: --help/--version exit inside argparse, and
+    # those invocations shouldn't touch the filesystem at all
+    args = parse_args()
+
     # Ensure memdir structure exists
     ensure_memdir_structure()
     
-    # Parse arguments
-    args = parse_args()
-    
     # Execute command
     if args.command == "create":
         create_memory(args)
@@ -588,11 +588,12 @@ class MemdirFolderManager:
 
 
 # Command-line interface
-def parse_args():
+def parse_args(argv=None):
     """Parse command-line arguments"""
     import argparse
     
-    parser = argparse.ArgumentParser(description="Memory Folder Management")
+    parser = argparse.ArgumentParser(prog="memdir_tools.folders",
+                                     description="Memory Folder Management")
     
     subparsers = parser.add_subparsers(dest="command", help="Commands")
     
@@ -643,11 +644,11 @@ def parse_args():
                            help="Operation to perform")
     tag_parser.add_argument("--statuses", help="Comma-separated list of statuses to process (default: cur)")
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
     
-def main():
+def main(argv=None):
     """Main entry point"""
-    args = parse_args()
+    args = parse_args(argv)
     
     # Create folder manager
     manager = MemdirFolderManager()
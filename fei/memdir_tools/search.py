@@ -593,7 +593,7 @@ def print_search_results(results: List[Dict[str, Any]], output_format: str = "te
             print_memory(memory, "content" in memory)
             print("----------------------------------")
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point"""
     # Create parser with detailed description
     parser = argparse.ArgumentParser(
@@ -668,7 +668,7 @@ For more detailed documentation, see: /root/hacks/memdir_tools/SEARCH_README.md
     output_group.add_argument("--with-content", action="store_true", help="Include memory content in results")
     output_group.add_argument("--debug", action="store_true", help="Show debug information")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Build query from command line arguments
     query = SearchQuery()
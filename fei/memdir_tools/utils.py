@@ -31,6 +31,13 @@ FLAGS = {
 
 def ensure_memdir_structure() -> None:
     """Ensure that the base Memdir structure exists"""
+    # A marker written after the first full pass trades the whole mkdir
+    # walk for a single stat on later invocations; delete the marker to
+    # force a rebuild
+    marker = os.path.join(MEMDIR_BASE, ".memdir_ready")
+    if os.path.exists(marker):
+        return
+
     # Create base directories
     for folder in STANDARD_FOLDERS:
         os.makedirs(os.path.join(MEMDIR_BASE, folder), exist_ok=True)
@@ -40,6 +47,9 @@ def ensure_memdir_structure() -> None:
         for folder in STANDARD_FOLDERS:
             os.makedirs(os.path.join(MEMDIR_BASE, special, folder), exist_ok=True)
 
+    # Mark the structure as complete
+    open(marker, "w").close()
+
 def get_memdir_folders() -> List[str]:
     """Get list of all memdir folders"""
     folders = []
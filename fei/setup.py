@@ -24,7 +24,7 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     install_requires=[
         "anthropic>=0.49.0",
         "litellm>=1.26.0",
@@ -35,6 +35,11 @@ setup(
         "textual>=0.47.1",
         "tree-sitter-languages>=1.8.0",
     ],
+    extras_require={
+        "speedups": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "fei=fei.__main__:main",
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Round-trip test for the config file reader/writer
+"""
+
+import os
+import tempfile
+from fei.utils.config import Config
+
+
+def test_multiline_value_roundtrip():
+    """Multi-line string values survive save + reload"""
+    signature = "line one\nline two\nline three"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = os.path.join(tmp_dir, "config.ini")
+
+        config = Config(config_path=config_path)
+        config.set("user.signature", signature)
+        config.set("user.name", "tester")
+        config.save_config()
+
+        reloaded = Config(config_path=config_path, force_reload=True)
+        assert reloaded.get("user.signature") == signature
+        assert reloaded.get("user.name") == "tester"
+
+
+def test_plain_values_roundtrip():
+    """Single-line values and multiple sections survive save + reload"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = os.path.join(tmp_dir, "config.ini")
+
+        config = Config(config_path=config_path)
+        config.set("llm.provider", "anthropic")
+        config.set("app.debug", "true")
+        config.save_config()
+
+        reloaded = Config(config_path=config_path, force_reload=True)
+        assert reloaded.get("llm.provider") == "anthropic"
+        assert reloaded.get("app.debug") == "true"